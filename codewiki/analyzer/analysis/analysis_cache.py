@@ -0,0 +1,143 @@
+"""
+Analysis Cache
+
+Persistent per-file cache of language analyzer results. Entries are keyed by
+repository root and file path and validated against a hash of the file
+content, so unchanged files skip tree-sitter parsing on later runs.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from codewiki import __version__
+
+logger = logging.getLogger(__name__)
+
+# Bump when analyzer output changes without a package version bump
+ANALYZER_VERSION = 2
+
+# Bump when the results table changes; older databases are rebuilt
+_SCHEMA_VERSION = 2
+
+_CACHE_VERSION = f"{__version__}:{ANALYZER_VERSION}"
+
+# One connection per (process, cache file); connections must not cross a fork
+_connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+
+
+def _connect(cache_path: str) -> sqlite3.Connection:
+    """Get or open this process's connection to the cache database."""
+    key = (os.getpid(), cache_path)
+    conn = _connections.get(key)
+    if conn is None:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(cache_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Workers open the database concurrently; take the write lock before
+        # checking the schema so only one of them rebuilds it
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS results")
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "root TEXT, path TEXT, lang TEXT, sha BLOB, ver TEXT, blob BLOB, "
+                "PRIMARY KEY (root, path, lang))"
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            conn.close()
+            raise
+        _connections[key] = conn
+    return conn
+
+
+def content_digest(data: bytes) -> bytes:
+    """Hash raw file bytes for cache validation."""
+    return hashlib.sha256(data).digest()
+
+
+def load_result(
+    cache_path: str, repo_dir: str, file_path: str, language: str, digest: bytes
+) -> Optional[Any]:
+    """
+    Return the cached analyzer result for a file, or None on a miss.
+
+    Component ids depend on the repository root, so entries are scoped to
+    it. A stored entry only counts as a hit when both the content hash and
+    the analyzer version match.
+    """
+    try:
+        row = _connect(cache_path).execute(
+            "SELECT blob FROM results "
+            "WHERE root = ? AND path = ? AND lang = ? AND sha = ? AND ver = ?",
+            (os.path.abspath(repo_dir), file_path, language, digest, _CACHE_VERSION),
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+    except Exception as e:
+        logger.debug(f"Analysis cache read failed for {file_path}: {e}")
+        return None
+
+
+def store_result(
+    cache_path: str, repo_dir: str, file_path: str, language: str, digest: bytes, result: Any
+) -> None:
+    """Store an analyzer result, replacing any older entry for the file."""
+    try:
+        conn = _connect(cache_path)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (os.path.abspath(repo_dir), file_path, language, digest, _CACHE_VERSION,
+                 pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+    except Exception as e:
+        logger.debug(f"Analysis cache write failed for {file_path}: {e}")
+
+
+def prune_results(cache_path: str, repo_dir: str, file_paths: Iterable[str]) -> None:
+    """Drop entries under repo_dir for files that are no longer analyzed."""
+    root = os.path.abspath(repo_dir)
+    try:
+        conn = _connect(cache_path)
+        stored = {path for (path,) in conn.execute("SELECT path FROM results WHERE root = ?", (root,))}
+        stale = stored.difference(file_paths)
+        if stale:
+            with conn:
+                conn.executemany(
+                    "DELETE FROM results WHERE root = ? AND path = ?",
+                    ((root, path) for path in stale),
+                )
+    except Exception as e:
+        logger.debug(f"Analysis cache prune failed for {root}: {e}")
+
+
+def close_cache(cache_path: str) -> None:
+    """
+    Checkpoint the write-ahead log and close this process's connection.
+
+    Call once workers have exited; closing the last connection folds the
+    WAL back into the database and removes the -wal/-shm side files.
+    """
+    conn = _connections.pop((os.getpid(), cache_path), None)
+    if conn is None:
+        if not os.path.exists(cache_path):
+            return
+        try:
+            conn = sqlite3.connect(cache_path, timeout=30)
+        except Exception as e:
+            logger.debug(f"Analysis cache close failed for {cache_path}: {e}")
+            return
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except Exception as e:
+        logger.debug(f"Analysis cache checkpoint failed for {cache_path}: {e}")
+    finally:
+        conn.close()
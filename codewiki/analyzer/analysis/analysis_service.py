@@ -7,7 +7,6 @@ AST parsing for call graph generation.
 """
 
 import logging
-import traceback
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from codewiki.analyzer.utils.security import safe_open_text, assert_safe_path
@@ -46,9 +45,13 @@ class AnalysisService:
 
     """
 
-    def __init__(self):
-        """Initialize the analysis service with language-specific analyzers."""
-        self.call_graph_analyzer = CallGraphAnalyzer()
+    def __init__(self, cache_path: Optional[str] = None):
+        """Initialize the analysis service with language-specific analyzers.
+
+        Args:
+            cache_path: Optional per-file analysis cache database for the call graph analyzer
+        """
+        self.call_graph_analyzer = CallGraphAnalyzer(cache_path=cache_path)
         self._temp_directories = []
 
     def analyze_local_repository(
@@ -225,8 +228,7 @@ class AnalysisService:
         except Exception as e:
             if temp_dir:
                 self._cleanup_repository(temp_dir)
-            logger.error(f"Structure analysis failed for {github_url}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error(f"Structure analysis failed for {github_url}: {str(e)}", exc_info=True)
             raise RuntimeError(f"Structure analysis failed: {str(e)}") from e
 
     def _clone_repository(self, github_url: str) -> str:
@@ -6,21 +6,123 @@ Coordinates language-specific analyzers to build comprehensive call graphs
 across different programming languages in a repository.
 """
 
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Callable, Dict, List, Tuple, Optional, Set
+import heapq
+import importlib
 import logging
 import os
-import traceback
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from pydantic import TypeAdapter
 from codewiki.analyzer.models.core import Node, CallRelationship
+from codewiki.analyzer.analysis.analysis_cache import (
+    close_cache,
+    content_digest,
+    load_result,
+    prune_results,
+    store_result,
+)
 from codewiki.analyzer.utils.patterns import CODE_EXTENSIONS
-from codewiki.analyzer.utils.security import safe_open_text
+from codewiki.analyzer.utils.security import safe_open_bytes, safe_open_text
 
 logger = logging.getLogger(__name__)
 
+# Serialize whole result lists in one call instead of model_dump() per item
+_NODE_LIST_ADAPTER = TypeAdapter(List[Node])
+_RELATIONSHIP_LIST_ADAPTER = TypeAdapter(List[CallRelationship])
+
+
+# language -> (module, function) of the hand-coded analyzer, imported on first use
+_ANALYZER_MODULES: Dict[str, Tuple[str, str]] = {
+    "python": ("codewiki.analyzer.languages.python", "analyze_python_file"),
+    "javascript": ("codewiki.analyzer.languages.javascript", "analyze_javascript_file_treesitter"),
+    "typescript": ("codewiki.analyzer.languages.typescript", "analyze_typescript_file_treesitter"),
+    "java": ("codewiki.analyzer.languages.java", "analyze_java_file"),
+    "csharp": ("codewiki.analyzer.languages.csharp", "analyze_csharp_file"),
+    "c": ("codewiki.analyzer.languages.c", "analyze_c_file"),
+    "cpp": ("codewiki.analyzer.languages.cpp", "analyze_cpp_file"),
+    "php": ("codewiki.analyzer.languages.php", "analyze_php_file"),
+    "go": ("codewiki.analyzer.languages.golang", "analyze_go_file"),
+    "vue": ("codewiki.analyzer.languages.vue", "analyze_vue_file"),
+}
+
+# File extension -> Cytoscape language class for visualization nodes
+_LANGUAGE_CLASSES: Dict[str, str] = {
+    ".py": "lang-python",
+    ".js": "lang-javascript",
+    ".ts": "lang-typescript",
+    ".c": "lang-c",
+    ".h": "lang-c",
+    ".cpp": "lang-cpp",
+    ".cc": "lang-cpp",
+    ".cxx": "lang-cpp",
+    ".hpp": "lang-cpp",
+    ".hxx": "lang-cpp",
+    ".php": "lang-php",
+    ".phtml": "lang-php",
+    ".inc": "lang-php",
+    ".go": "lang-go",
+    ".vue": "lang-vue",
+}
+
+# Per-process cache of resolved hand-coded analyzer functions
+_ANALYZERS: Dict[str, Callable] = {}
+
+
+def _language_analyzer(language: str) -> Optional[Callable]:
+    """Return the hand-coded analyzer function for a language, importing it once."""
+    analyzer = _ANALYZERS.get(language)
+    if analyzer is None:
+        spec = _ANALYZER_MODULES.get(language)
+        if spec is None:
+            return None
+        module_name, func_name = spec
+        analyzer = getattr(importlib.import_module(module_name), func_name)
+        _ANALYZERS[language] = analyzer
+    return analyzer
+
+
+def _warm_analyzers(languages: List[str]) -> None:
+    """
+    Worker initializer: import analyzers and build query parsers up front.
+
+    Runs once per worker process so the first file of each language does not
+    pay for module imports and grammar/query compilation.
+    """
+    from codewiki.analyzer.query_analyzer import _get_parser, _get_query
+
+    for language in languages:
+        try:
+            _language_analyzer(language)
+            if language not in ("go", "vue"):
+                _get_parser(language)
+                _get_query(language)
+        except Exception as e:
+            logger.debug(f"Failed to preload analyzer for {language}: {e}")
+
+
+def _decode_source(data: bytes) -> Tuple[str, Optional[bytes]]:
+    """
+    Decode file bytes the way safe_open_text() reads them.
+
+    Returns the text (invalid UTF-8 replaced, newlines translated to "\\n")
+    and the original bytes when they are exactly the UTF-8 encoding of that
+    text, or None when decoding changed anything.
+    """
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError:
+        content = data.decode("utf-8", errors="replace")
+        data = None
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+        data = None
+    return content, data
+
 
 def _dispatch_language_analyzer(
-    language: str, file_path, content: str, repo_dir: str
+    language: str, file_path, content: str, repo_dir: str, source: Optional[bytes] = None
 ) -> Optional[Tuple[List[Node], List[CallRelationship]]]:
     """
     Dispatch to the appropriate language-specific analyzer.
@@ -33,58 +135,39 @@ def _dispatch_language_analyzer(
         file_path: Path to the file
         content: File content string
         repo_dir: Repository base directory path
+        source: Optional UTF-8 bytes of content, parsed as-is by the query and Go analyzers
 
     Returns:
         Tuple of (nodes, relationships) or None if language is unsupported
     """
-    # Vue requires two-stage parsing - always use hand-coded analyzer
-    if language == "vue":
-        from codewiki.analyzer.languages.vue import analyze_vue_file
-        return analyze_vue_file(file_path, content, repo_path=repo_dir)
-
-    # Try query-based analyzer first (skip Go: hand-coded analyzer has type resolution)
-    if language != "go":
+    if language not in _ANALYZER_MODULES:
+        return None
+    # Blank files define nothing; skip grammar loading and parsing entirely
+    if not content or content.isspace():
+        return [], []
+
+    # Try query-based analyzer first (skip Go: hand-coded analyzer has type resolution;
+    # Vue requires two-stage parsing - always use hand-coded analyzer)
+    if language != "go" and language != "vue":
         try:
             from codewiki.analyzer.query_analyzer import analyze_file_with_queries
-            result = analyze_file_with_queries(language, file_path, content, repo_dir)
+            result = analyze_file_with_queries(language, file_path, content, repo_dir, source)
             if result is not None:
                 return result
         except Exception as e:
             logger.debug(f"Query-based analyzer failed for {language}, falling back: {e}")
 
     # Fall back to hand-coded analyzers
-    if language == "python":
-        from codewiki.analyzer.languages.python import analyze_python_file
-        return analyze_python_file(file_path, content, repo_path=repo_dir)
-    elif language == "javascript":
-        from codewiki.analyzer.languages.javascript import analyze_javascript_file_treesitter
-        return analyze_javascript_file_treesitter(file_path, content, repo_path=repo_dir)
-    elif language == "typescript":
-        from codewiki.analyzer.languages.typescript import analyze_typescript_file_treesitter
-        return analyze_typescript_file_treesitter(file_path, content, repo_path=repo_dir)
-    elif language == "java":
-        from codewiki.analyzer.languages.java import analyze_java_file
-        return analyze_java_file(file_path, content, repo_path=repo_dir)
-    elif language == "csharp":
-        from codewiki.analyzer.languages.csharp import analyze_csharp_file
-        return analyze_csharp_file(file_path, content, repo_path=repo_dir)
-    elif language == "c":
-        from codewiki.analyzer.languages.c import analyze_c_file
-        return analyze_c_file(file_path, content, repo_path=repo_dir)
-    elif language == "cpp":
-        from codewiki.analyzer.languages.cpp import analyze_cpp_file
-        return analyze_cpp_file(file_path, content, repo_path=repo_dir)
-    elif language == "php":
-        from codewiki.analyzer.languages.php import analyze_php_file
-        return analyze_php_file(file_path, content, repo_path=repo_dir)
-    elif language == "go":
-        from codewiki.analyzer.languages.golang import analyze_go_file
-        return analyze_go_file(file_path, content, repo_path=repo_dir)
-    return None
+    analyzer = _language_analyzer(language)
+    if analyzer is None:
+        return None
+    if language == "go":
+        return analyzer(file_path, content, repo_path=repo_dir, source=source)
+    return analyzer(file_path, content, repo_path=repo_dir)
 
 
 def analyze_single_file(
-    repo_dir: str, file_info: Dict
+    repo_dir: str, file_info: Dict, cache_path: Optional[str] = None
 ) -> Tuple[Dict[str, Node], List[CallRelationship], Optional[str], Dict[str, Set[str]], Dict[str, Set[str]]]:
     """
     Analyze a single code file and return results.
@@ -95,6 +178,8 @@ def analyze_single_file(
     Args:
         repo_dir: Repository directory path
         file_info: File information dictionary with 'path', 'language', etc.
+        cache_path: Optional analysis cache database; unchanged files are
+            served from it instead of being parsed again
 
     Returns:
         Tuple of (functions dict, relationships list, error message or None,
@@ -106,14 +191,24 @@ def analyze_single_file(
     interface_methods: Dict[str, Set[str]] = {}
     struct_methods: Dict[str, Set[str]] = {}
 
-    base = Path(repo_dir)
-    file_path = base / file_info["path"]
+    # Plain strings: workers never need PurePath objects for the file path
+    file_path = os.path.normpath(os.path.join(repo_dir, file_info["path"]))
 
     try:
-        content = safe_open_text(base, file_path)
-        file_results = _dispatch_language_analyzer(
-            file_info["language"], file_path, content, repo_dir
-        )
+        # Read bytes once: they feed the cache digest and, when decoding is
+        # lossless, the tree-sitter parser without a decode/encode round trip
+        data = safe_open_bytes(repo_dir, file_path)
+        language = file_info["language"]
+
+        file_results = None
+        if cache_path:
+            digest = content_digest(data)
+            file_results = load_result(cache_path, repo_dir, file_path, language, digest)
+        if file_results is None:
+            content, source = _decode_source(data)
+            file_results = _dispatch_language_analyzer(language, file_path, content, repo_dir, source)
+            if cache_path and file_results is not None:
+                store_result(cache_path, repo_dir, file_path, language, digest, file_results)
 
         if file_results:
             if len(file_results) == 4:
@@ -123,7 +218,9 @@ def analyze_single_file(
             for func in funcs:
                 func_id = func.id if func.id else f"{file_path}:{func.name}"
                 functions[func_id] = func
-            call_relationships = rels
+            # Repeated call sites are mostly within one file; drop them before
+            # the result is pickled back (the parent still dedups across files)
+            call_relationships = _unique_relationships(rels)
 
     except Exception as e:
         error = f"Error analyzing {file_path}: {str(e)}"
@@ -131,9 +228,80 @@ def analyze_single_file(
     return functions, call_relationships, error, interface_methods, struct_methods
 
 
+def analyze_file_batch(
+    repo_dir: str, file_infos: List[Dict], cache_path: Optional[str] = None
+) -> List[Tuple]:
+    """
+    Analyze a batch of code files in one call.
+
+    Workers receive files in batches so the submit/pickle round trip is paid
+    per batch rather than per file. Must be at module level for pickle
+    compatibility.
+
+    Args:
+        repo_dir: Repository directory path
+        file_infos: File information dictionaries to analyze, in order
+        cache_path: Optional analysis cache database, see analyze_single_file()
+
+    Returns:
+        One analyze_single_file() result tuple per file, in the same order
+    """
+    return [analyze_single_file(repo_dir, file_info, cache_path) for file_info in file_infos]
+
+
+def _batch_by_size(code_files: List[Dict], num_batches: int) -> List[List[int]]:
+    """
+    Split files into at most num_batches batches of similar total size.
+
+    Greedy longest-processing-time packing: files are taken largest first and
+    each goes to the currently lightest batch, so one huge file does not
+    leave a single worker running long after the others. Sizes come from
+    the "size" key set by extract_code_files; every file weighs at least one
+    byte so empty or unsized files still spread out.
+
+    Returns:
+        Batches of indices into code_files, each in ascending order
+    """
+    if not code_files:
+        return []
+    weights = [max(file_info.get("size", 0), 1) for file_info in code_files]
+    num_batches = max(1, min(num_batches, len(code_files)))
+
+    batches: List[List[int]] = [[] for _ in range(num_batches)]
+    loads = [(0, batch_no) for batch_no in range(num_batches)]
+    for index in sorted(range(len(code_files)), key=weights.__getitem__, reverse=True):
+        load, batch_no = loads[0]
+        batches[batch_no].append(index)
+        heapq.heapreplace(loads, (load + weights[index], batch_no))
+
+    for batch in batches:
+        batch.sort()
+    return batches
+
+
+def _unique_relationships(relationships: List[CallRelationship]) -> List[CallRelationship]:
+    """Drop repeated caller/callee pairs, keeping the first relationship of each."""
+    # Insertion-ordered dict; setdefault keeps the first relationship per pair
+    unique: Dict[Tuple[str, str], CallRelationship] = {}
+    for rel in relationships:
+        unique.setdefault((rel.caller, rel.callee), rel)
+    return list(unique.values())
+
+
+def _name_tail(identifier: str) -> str:
+    """Bare function name at the end of a component id or "file:name" key."""
+    return identifier.rpartition(":")[2].rpartition(".")[2]
+
+
 class CallGraphAnalyzer:
-    def __init__(self):
-        """Initialize the call graph analyzer."""
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize the call graph analyzer.
+
+        Args:
+            cache_path: Optional path of a per-file analysis cache database
+        """
+        self.cache_path = cache_path
         self.functions: Dict[str, Node] = {}
         self.call_relationships: List[CallRelationship] = []
         self._go_interface_methods: Dict[str, Set[str]] = {}  # InterfaceName -> {method sigs}
@@ -154,39 +322,105 @@ class CallGraphAnalyzer:
 
         self.functions = {}
         self.call_relationships = []
+        self._go_interface_methods = {}
+        self._go_struct_methods = {}
 
         files_analyzed = 0
         failed_files: List[str] = []
         num_workers = os.cpu_count() or 4
 
         try:
-            with ProcessPoolExecutor(max_workers=num_workers) as executor:
-                futures = {
-                    executor.submit(analyze_single_file, base_dir, file_info): file_info
-                    for file_info in code_files
-                }
-
-                for future in as_completed(futures):
-                    file_info = futures[future]
+            languages = sorted({file_info["language"] for file_info in code_files})
+            with ProcessPoolExecutor(
+                max_workers=num_workers, initializer=_warm_analyzers, initargs=(languages,)
+            ) as executor:
+                # A few batches per worker keeps the pool busy when batch costs differ
+                batches = iter(_batch_by_size(code_files, num_workers * 4))
+
+                # Keep a bounded window of batches in flight so finished results
+                # are merged (and released) before the pool races ahead
+                in_flight: deque = deque()
+
+                def submit_next() -> None:
+                    batch = next(batches, None)
+                    if batch is not None:
+                        file_infos = [code_files[index] for index in batch]
+                        in_flight.append(
+                            (batch, executor.submit(analyze_file_batch, base_dir, file_infos, self.cache_path))
+                        )
+
+                for _ in range(num_workers * 2):
+                    submit_next()
+
+                # Batches mix files from across the list, so each batch is merged
+                # as it arrives and the result is dropped. Per-file lists are
+                # kept by file index and chained in file order at the end, and
+                # duplicate ids keep the definition from the latest file, so the
+                # output matches a sequential run.
+                functions = self.functions
+                # func_id -> file index of the definition kept in self.functions
+                owners: Dict[str, int] = {}
+                # func_id -> (file index, position) of its first definition
+                first_seen: Dict[str, Tuple[int, int]] = {}
+                relationships: List[Optional[List[CallRelationship]]] = [None] * len(code_files)
+                go_methods: List[Optional[Tuple[Dict, Dict]]] = [None] * len(code_files)
+                failed: List[int] = []
+
+                while in_flight:
+                    batch, future = in_flight.popleft()
+                    submit_next()
                     try:
-                        funcs, rels, error, iface_methods, struct_methods = future.result()
+                        batch_results = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to get results for a batch of {len(batch)} file(s): {e}")
+                        failed.extend(batch)
+                        continue
+                    finally:
+                        del future
+
+                    for index, result in zip(batch, batch_results, strict=True):
+                        funcs, rels, error, iface_methods, struct_methods = result
                         if error:
                             logger.error(error)
-                            failed_files.append(file_info['path'])
-                        else:
-                            logger.debug(f"Analyzed: {file_info['path']}")
-                            self.functions.update(funcs)
-                            self.call_relationships.extend(rels)
-                            # Aggregate Go interface/struct method data
-                            self._go_interface_methods.update(iface_methods)
-                            self._go_struct_methods.update(struct_methods)
-                            files_analyzed += 1
-                    except Exception as e:
-                        logger.error(f"Failed to get result for {file_info['path']}: {e}")
-                        failed_files.append(file_info['path'])
+                            failed.append(index)
+                            continue
+                        logger.debug(f"Analyzed: {code_files[index]['path']}")
+                        for position, (func_id, func) in enumerate(funcs.items()):
+                            owner = owners.get(func_id)
+                            if owner is None:
+                                first_seen[func_id] = (index, position)
+                            elif owner > index:
+                                if first_seen[func_id][0] > index:
+                                    first_seen[func_id] = (index, position)
+                                continue
+                            functions[func_id] = func
+                            owners[func_id] = index
+                        relationships[index] = rels
+                        if iface_methods or struct_methods:
+                            go_methods[index] = (iface_methods, struct_methods)
+                        files_analyzed += 1
+                    del batch_results
+
+            # Restore the order a sequential run inserts ids, files and relationships in
+            self.functions = {
+                func_id: functions[func_id] for func_id in sorted(functions, key=first_seen.__getitem__)
+            }
+            for rels in relationships:
+                if rels:
+                    self.call_relationships.extend(rels)
+            for methods in go_methods:
+                if methods:
+                    # Aggregate Go interface/struct method data
+                    self._go_interface_methods.update(methods[0])
+                    self._go_struct_methods.update(methods[1])
+            failed_files = [code_files[index]['path'] for index in sorted(failed)]
 
         except Exception as e:
             logger.warning(f"Parallel analysis failed, falling back to sequential: {e}")
+            self.functions = {}
+            self.call_relationships = []
+            self._go_interface_methods = {}
+            self._go_struct_methods = {}
             files_analyzed = 0
             failed_files = []
             for file_info in code_files:
@@ -194,6 +428,16 @@ class CallGraphAnalyzer:
                 self._analyze_code_file(base_dir, file_info)
                 files_analyzed += 1
 
+        if self.cache_path:
+            # Forget files deleted or renamed since the last run, then fold the
+            # workers' WAL writes back into the database
+            prune_results(
+                self.cache_path,
+                base_dir,
+                {os.path.normpath(os.path.join(base_dir, file_info["path"])) for file_info in code_files},
+            )
+            close_cache(self.cache_path)
+
         if failed_files:
             logger.warning(
                 f"{len(failed_files)} file(s) failed analysis: {failed_files}"
@@ -218,8 +462,8 @@ class CallGraphAnalyzer:
                 "files_analyzed": files_analyzed,
                 "analysis_approach": "complete_unlimited",
             },
-            "functions": [func.model_dump() for func in self.functions.values()],
-            "relationships": [rel.model_dump() for rel in self.call_relationships],
+            "functions": _NODE_LIST_ADAPTER.dump_python(list(self.functions.values())),
+            "relationships": _RELATIONSHIP_LIST_ADAPTER.dump_python(self.call_relationships),
             "visualization": viz_data,
         }
 
@@ -236,24 +480,32 @@ class CallGraphAnalyzer:
             List of code file information dictionaries
         """
         code_files = []
-
-        def traverse(tree):
-            if tree["type"] == "file":
+        language_for = CODE_EXTENSIONS.get
+
+        # Explicit stack instead of recursion; children are pushed reversed so
+        # files come out in the same pre-order as the tree
+        stack = [file_tree]
+        while stack:
+            tree = stack.pop()
+            node_type = tree["type"]
+            if node_type == "file":
                 ext = tree.get("extension", "").lower()
-                if ext in CODE_EXTENSIONS:
+                language = language_for(ext)
+                if language:
                     code_files.append(
                         {
                             "path": tree["path"],
                             "name": tree["name"],
                             "extension": ext,
-                            "language": CODE_EXTENSIONS[ext],
+                            "language": language,
+                            "size": tree.get("_size_bytes", 0),
                         }
                     )
-            elif tree["type"] == "directory" and tree.get("children"):
-                for child in tree["children"]:
-                    traverse(child)
+            elif node_type == "directory":
+                children = tree.get("children")
+                if children:
+                    stack.extend(reversed(children))
 
-        traverse(file_tree)
         return code_files
 
     def _analyze_code_file(self, repo_dir: str, file_info: Dict):
@@ -266,11 +518,10 @@ class CallGraphAnalyzer:
             repo_dir: Repository directory path
             file_info: File information dictionary
         """
-        base = Path(repo_dir)
-        file_path = base / file_info["path"]
+        file_path = os.path.normpath(os.path.join(repo_dir, file_info["path"]))
 
         try:
-            content = safe_open_text(base, file_path)
+            content = safe_open_text(repo_dir, file_path)
             file_results = _dispatch_language_analyzer(
                 file_info["language"], file_path, content, repo_dir
             )
@@ -289,7 +540,8 @@ class CallGraphAnalyzer:
 
         except Exception as e:
             logger.error(f"Error analyzing {file_path}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            # exc_info defers traceback formatting to handlers that emit DEBUG
+            logger.debug(f"Traceback for {file_path}", exc_info=True)
 
     def _resolve_call_relationships(self):
         """
@@ -304,9 +556,11 @@ class CallGraphAnalyzer:
         false dependency cycles.
         """
         # Qualified lookup: exact IDs, component IDs, ReceiverType.Method keys
-        qualified_lookup = {}
+        qualified_lookup: Dict[str, str] = {}
         # Module-scoped lookup: directory -> {bare_name -> func_id, "Type.Method" -> func_id}
-        module_lookup: Dict[str, Dict[str, str]] = {}
+        module_lookup: Dict[str, Dict[str, str]] = defaultdict(dict)
+        # func_id -> module-scoped lookup of the directory it lives in
+        func_modules: Dict[str, Dict[str, str]] = {}
 
         for func_id, func_info in self.functions.items():
             qualified_lookup[func_id] = func_id
@@ -314,42 +568,39 @@ class CallGraphAnalyzer:
                 qualified_lookup[func_info.component_id] = func_id
 
             # Build module-scoped lookup using the file's directory as module key
-            module_path = os.path.dirname(func_info.relative_path or func_info.file_path or "")
-            if module_path not in module_lookup:
-                module_lookup[module_path] = {}
-            module_lookup[module_path][func_info.name] = func_id
+            module_funcs = module_lookup[os.path.dirname(func_info.relative_path or func_info.file_path or "")]
+            module_funcs[func_info.name] = func_id
+            func_modules[func_id] = module_funcs
 
             # Add ReceiverType.MethodName key (scoped to module)
             if func_info.class_name and func_info.name:
                 class_method_key = f"{func_info.class_name}.{func_info.name}"
                 qualified_lookup[class_method_key] = func_id
-                module_lookup[module_path][class_method_key] = func_id
+                module_funcs[class_method_key] = func_id
 
         for relationship in self.call_relationships:
             callee_name = relationship.callee
 
             # 1. Try qualified/exact match first
-            if callee_name in qualified_lookup:
-                relationship.callee = qualified_lookup[callee_name]
+            resolved = qualified_lookup.get(callee_name)
+            if resolved is not None:
+                relationship.callee = resolved
                 relationship.is_resolved = True
                 continue
 
             # 2. For dotted names, try Type.Method qualified, then module-scoped
-            if "." in callee_name:
+            head, dot, bare_name = callee_name.rpartition(".")
+            if dot:
                 # Try the short Type.Method form in qualified lookup
-                parts = callee_name.rsplit(".", 1)
-                short_key = f"{parts[0].split('.')[-1]}.{parts[1]}" if len(parts) == 2 else callee_name
+                short_key = f"{head.rpartition('.')[2]}.{bare_name}"
                 if short_key in qualified_lookup:
                     relationship.callee = qualified_lookup[short_key]
                     relationship.is_resolved = True
                     continue
 
             # 3. Module-scoped bare-name fallback: only match within caller's directory
-            caller_func = self.functions.get(relationship.caller)
-            if caller_func:
-                caller_module = os.path.dirname(caller_func.relative_path or caller_func.file_path or "")
-                module_funcs = module_lookup.get(caller_module, {})
-
+            module_funcs = func_modules.get(relationship.caller)
+            if module_funcs is not None:
                 # Try callee_name as-is in same module
                 if callee_name in module_funcs:
                     relationship.callee = module_funcs[callee_name]
@@ -357,12 +608,9 @@ class CallGraphAnalyzer:
                     continue
 
                 # Try bare method name in same module (for dotted callees)
-                if "." in callee_name:
-                    bare_name = callee_name.split(".")[-1]
-                    if bare_name in module_funcs:
-                        relationship.callee = module_funcs[bare_name]
-                        relationship.is_resolved = True
-                        continue
+                if dot and bare_name in module_funcs:
+                    relationship.callee = module_funcs[bare_name]
+                    relationship.is_resolved = True
 
     def _deduplicate_relationships(self):
         """
@@ -371,16 +619,7 @@ class CallGraphAnalyzer:
         Removes duplicate relationships while preserving the first occurrence.
         This helps eliminate noise from multiple calls to the same function.
         """
-        seen = set()
-        unique_relationships = []
-
-        for rel in self.call_relationships:
-            key = (rel.caller, rel.callee)
-            if key not in seen:
-                seen.add(key)
-                unique_relationships.append(rel)
-
-        self.call_relationships = unique_relationships
+        self.call_relationships = _unique_relationships(self.call_relationships)
 
     def _match_interface_implementations(self):
         """Match structs to interfaces they satisfy based on method sets."""
@@ -431,31 +670,20 @@ class CallGraphAnalyzer:
             Dict: Visualization data with cytoscape elements and summary
         """
         cytoscape_elements = []
+        # file path -> (language class suffix, language); functions share files
+        file_languages: Dict[str, Tuple[str, str]] = {}
 
         for func_id, func_info in self.functions.items():
-            node_classes = []
-            if func_info.node_type == "method":
-                node_classes.append("node-method")
-            else:
-                node_classes.append("node-function")
-
-            file_ext = Path(func_info.file_path).suffix.lower()
-            if file_ext == ".py":
-                node_classes.append("lang-python")
-            elif file_ext == ".js":
-                node_classes.append("lang-javascript")
-            elif file_ext == ".ts":
-                node_classes.append("lang-typescript")
-            elif file_ext in [".c", ".h"]:
-                node_classes.append("lang-c")
-            elif file_ext in [".cpp", ".cc", ".cxx", ".hpp", ".hxx"]:
-                node_classes.append("lang-cpp")
-            elif file_ext in [".php", ".phtml", ".inc"]:
-                node_classes.append("lang-php")
-            elif file_ext == ".go":
-                node_classes.append("lang-go")
-            elif file_ext == ".vue":
-                node_classes.append("lang-vue")
+            file_language = file_languages.get(func_info.file_path)
+            if file_language is None:
+                file_ext = Path(func_info.file_path).suffix.lower()
+                lang_class = _LANGUAGE_CLASSES.get(file_ext)
+                file_language = file_languages[func_info.file_path] = (
+                    f" {lang_class}" if lang_class else "",
+                    CODE_EXTENSIONS.get(file_ext, "unknown"),
+                )
+            lang_class, language = file_language
+            node_class = "node-method" if func_info.node_type == "method" else "node-function"
 
             cytoscape_elements.append(
                 {
@@ -464,9 +692,9 @@ class CallGraphAnalyzer:
                         "label": func_info.name,
                         "file": func_info.file_path,
                         "type": func_info.node_type or "function",
-                        "language": CODE_EXTENSIONS.get(file_ext, "unknown"),
+                        "language": language,
                     },
-                    "classes": " ".join(node_classes),
+                    "classes": node_class + lang_class,
                 }
             )
 
@@ -497,6 +725,20 @@ class CallGraphAnalyzer:
 
     def generate_llm_format(self) -> Dict:
         """Generate clean format optimized for LLM consumption."""
+        # Index relationships once by the bare name at the end of each id
+        # (after any "file:" prefix and package/class qualifiers), so a
+        # function only picks up its own calls: "foo" no longer matches "barfoo"
+        calls: Dict[str, List[str]] = defaultdict(list)
+        called_by: Dict[str, List[str]] = defaultdict(list)
+        # Recursion is a call from a function to its own id, not to any same-named one
+        recursive: Set[str] = set()
+        for rel in self.call_relationships:
+            if rel.caller == rel.callee:
+                recursive.add(rel.caller)
+            if rel.is_resolved:
+                calls[_name_tail(rel.caller)].append(rel.callee.split(":")[-1])
+                called_by[_name_tail(rel.callee)].append(rel.caller.split(":")[-1])
+
         return {
             "functions": [
                 {
@@ -504,29 +746,15 @@ class CallGraphAnalyzer:
                     "file": Path(func.file_path).name,
                     "purpose": (func.docstring.split("\n")[0] if func.docstring else None),
                     "parameters": func.parameters,
-                    "is_recursive": func.name
-                    in [
-                        rel.callee
-                        for rel in self.call_relationships
-                        if rel.caller.endswith(func.name)
-                    ],
+                    "is_recursive": func_id in recursive,
                 }
-                for func in self.functions.values()
+                for func_id, func in self.functions.items()
             ],
             "relationships": {
                 func.name: {
-                    "calls": [
-                        rel.callee.split(":")[-1]
-                        for rel in self.call_relationships
-                        if rel.caller.endswith(func.name) and rel.is_resolved
-                    ],
-                    "called_by": [
-                        rel.caller.split(":")[-1]
-                        for rel in self.call_relationships
-                        if rel.callee.endswith(func.name) and rel.is_resolved
-                    ],
+                    "calls": calls.get(func.name, []),
+                    "called_by": called_by.get(func.name, []),
                 }
                 for func in self.functions.values()
             },
         }
-
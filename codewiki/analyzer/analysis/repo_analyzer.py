@@ -41,30 +41,36 @@ class RepoAnalyzer:
         }
 
     def _build_file_tree(self, repo_dir: str) -> Dict:
-        def build_tree(path: Path, base_path: Path) -> Optional[Dict]:
+        base_resolved = Path(repo_dir).resolve()
+
+        def build_tree(
+            path: Path, base_path: Path, entry: Optional[os.DirEntry] = None
+        ) -> Optional[Dict]:
+            # Children come with their scandir entry, whose type checks use the
+            # cached d_type instead of one stat call per question.
             relative_path = path.relative_to(base_path)
             relative_path_str = str(relative_path)
 
             # 🚫 Reject symlinks
-            if path.is_symlink():
+            if entry.is_symlink() if entry is not None else path.is_symlink():
                 return None
 
             # 🚫 Reject escaped paths (e.g., symlinks pointing outside)
             try:
-                if not path.resolve().is_relative_to(base_path.resolve()):
+                if not path.resolve().is_relative_to(base_resolved):
                     return None
             except AttributeError:
-                if not str(path.resolve()).startswith(str(base_path.resolve())):
+                if not str(path.resolve()).startswith(str(base_resolved)):
                     return None
 
             if self._should_exclude_path(relative_path_str, path.name):
                 return None
 
-            if path.is_file():
+            if entry.is_file() if entry is not None else path.is_file():
                 if not self._should_include_file(relative_path_str, path.name):
                     return None
 
-                size = path.stat().st_size
+                size = entry.stat().st_size if entry is not None else path.stat().st_size
                 return {
                     "type": "file",
                     "name": path.name,
@@ -73,11 +79,13 @@ class RepoAnalyzer:
                     "_size_bytes": size,
                 }
 
-            elif path.is_dir():
+            elif entry.is_dir() if entry is not None else path.is_dir():
                 children = []
                 try:
-                    for child in sorted(path.iterdir()):
-                        child_tree = build_tree(child, base_path)
+                    with os.scandir(path) as it:
+                        entries = sorted(it, key=lambda e: e.name)
+                    for child in entries:
+                        child_tree = build_tree(path / child.name, base_path, child)
                         if child_tree is not None:
                             children.append(child_tree)
                 except PermissionError:
@@ -17,7 +17,13 @@ logger = logging.getLogger(__name__)
 class DependencyParser:
     """Parser for extracting code components from multi-language repositories."""
     
-    def __init__(self, repo_path: str, include_patterns: List[str] = None, exclude_patterns: List[str] = None):
+    def __init__(
+        self,
+        repo_path: str,
+        include_patterns: List[str] = None,
+        exclude_patterns: List[str] = None,
+        cache_path: Optional[str] = None,
+    ):
         """
         Initialize the dependency parser.
         
@@ -25,6 +31,7 @@ class DependencyParser:
             repo_path: Path to the repository
             include_patterns: File patterns to include (e.g., ["*.cs", "*.py"])
             exclude_patterns: File/directory patterns to exclude (e.g., ["*Tests*"])
+            cache_path: Optional per-file analysis cache database
         """
         self.repo_path = os.path.abspath(repo_path)
         self.components: Dict[str, Node] = {}
@@ -32,7 +39,7 @@ class DependencyParser:
         self.include_patterns = include_patterns
         self.exclude_patterns = exclude_patterns
         
-        self.analysis_service = AnalysisService()
+        self.analysis_service = AnalysisService(cache_path=cache_path)
 
     def parse_repository(self, filtered_folders: List[str] = None) -> Dict[str, Node]:
         logger.debug(f"Parsing repository at {self.repo_path}")
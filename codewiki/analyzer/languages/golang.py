@@ -6,12 +6,17 @@ along with their dependency relationships (imports, struct embedding, interface
 function calls, method calls).
 """
 
+import bisect
 import logging
-from typing import List, Optional, Tuple, Dict, Set
+from functools import lru_cache
+import threading
+from typing import Any, List, Optional, Tuple, Dict, Set
 from pathlib import Path
 import os
+import re
+import sys
 
-from tree_sitter import Parser, Language
+from tree_sitter import Parser, Language, Query, QueryCursor
 import tree_sitter_go
 from codewiki.analyzer.models.core import Node, CallRelationship
 
@@ -24,6 +29,11 @@ GO_PRIMITIVES: Set[str] = {
     "float32", "float64", "complex64", "complex128",
     "string", "error", "any",
 }
+_GO_PRIMITIVES_LOWER = frozenset(p.lower() for p in GO_PRIMITIVES)
+
+# Leading "*", "[]", "[N]" and "map[K]" wrappers, then the (optionally
+# package-qualified) base type name
+_CLEAN_TYPE_RE = re.compile(r"^[*\[\]\d]*(?:map\[[^\]]*\])?([A-Za-z_]\w*)(?:\.(\w+))?")
 
 # Go built-in functions to exclude from call tracking
 GO_BUILTINS: Set[str] = {
@@ -32,28 +42,152 @@ GO_BUILTINS: Set[str] = {
     "real", "recover", "min", "max",
 }
 
+# Built once per process; every analyzed file reuses the same grammar
+try:
+    _GO_LANGUAGE: Optional[Language] = Language(tree_sitter_go.language())
+except Exception as e:
+    logger.error(f"Failed to load tree-sitter Go grammar: {e}")
+    _GO_LANGUAGE = None
+
+# Maps both path separators to "." in one pass for module paths
+_PATH_SEPARATORS_TO_DOTS = str.maketrans({"/": ".", "\\": "."})
+
+# Top-level nodes that can produce components; files without any
+# (doc.go, import-only stubs) have nothing to analyze
+_DECLARATION_TYPES = frozenset({"function_declaration", "method_declaration", "type_declaration"})
+
+# Node kinds read as a type in each context
+_NAMED_TYPE_KINDS = frozenset({"type_identifier", "qualified_type", "pointer_type"})
+_LITERAL_TYPE_KINDS = frozenset({"type_identifier", "qualified_type"})
+_DECLARED_TYPE_KINDS = _NAMED_TYPE_KINDS | {"slice_type", "map_type"}
+_SIGNATURE_TYPE_KINDS = _DECLARED_TYPE_KINDS | {"chan_type"}
+_PARAM_TYPE_KINDS = _SIGNATURE_TYPE_KINDS | {"interface_type"}
+_FIELD_TYPE_KINDS = _PARAM_TYPE_KINDS | {"function_type", "struct_type"}
+
+# Shared empty method set for receivers without methods in the file
+_NO_METHODS: Dict[str, Node] = {}
+
+# Everything the analyzer visits, matched in one native query run instead of
+# walking every syntax node in Python. Embedding sites are the plain type
+# name of a struct field or of an unnamed interface element.
+_DECLARATIONS_QUERY_TEXT = """
+(package_clause) @package
+(import_declaration) @import
+[(function_declaration) (method_declaration) (type_declaration)] @declaration
+(call_expression) @site
+(field_declaration type: (type_identifier) @site)
+(method_elem !name (type_identifier) @site)
+"""
+
+try:
+    _DECLARATIONS_QUERY: Optional[Query] = Query(_GO_LANGUAGE, _DECLARATIONS_QUERY_TEXT)
+except Exception as e:
+    logger.error(f"Failed to compile Go declarations query: {e}")
+    _DECLARATIONS_QUERY = None
+
+# Concurrency/error patterns flagged on a function when found in its body
+_BODY_PATTERNS_QUERY_TEXT = """
+(go_statement) @goroutine
+(select_statement) @select
+[(send_statement) (receive_statement) (channel_type)] @channel
+(defer_statement) @defer
+(call_expression function: (identifier) @panic (#eq? @panic "panic"))
+"""
+
+# Local variable declarations whose types seed a function's scope
+_VAR_DECLARATIONS_QUERY_TEXT = """
+[(short_var_declaration) (var_declaration)] @declaration
+"""
+
+# Patterns and declarations nested deeper than this below the body are ignored
+_BODY_SCAN_MAX_DEPTH = 50
+
+try:
+    _BODY_PATTERNS_QUERY: Optional[Query] = Query(_GO_LANGUAGE, _BODY_PATTERNS_QUERY_TEXT)
+except Exception as e:
+    logger.error(f"Failed to compile Go body patterns query: {e}")
+    _BODY_PATTERNS_QUERY = None
+
+try:
+    _VAR_DECLARATIONS_QUERY: Optional[Query] = Query(_GO_LANGUAGE, _VAR_DECLARATIONS_QUERY_TEXT)
+except Exception as e:
+    logger.error(f"Failed to compile Go variable declarations query: {e}")
+    _VAR_DECLARATIONS_QUERY = None
+
+
+def _in_tree_order(nodes: List) -> List:
+    """Sort captured nodes into pre-order (outer node first on equal starts)."""
+    return sorted(nodes, key=lambda n: (n.start_byte, -n.end_byte))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_type_name(type_text: str) -> str:
+    """Normalize a Go type to its base type name (strip *, [], package prefix)."""
+    t = type_text.strip()
+    while t.startswith("*"):
+        t = t[1:].strip()
+    while t.startswith("[]"):
+        t = t[2:].strip()
+    if "." in t:
+        t = t.split(".")[-1]
+    return t
+
+
+# Parsers are reused across files but must not be shared between threads
+_TLS = threading.local()
+
+
+def _go_parser() -> Parser:
+    """Return this thread's Go parser, creating it on first use."""
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        parser = _TLS.parser = Parser(_GO_LANGUAGE)
+    return parser
+
 
 class TreeSitterGoAnalyzer:
     """Analyzes Go files using tree-sitter to extract nodes and relationships."""
 
-    def __init__(self, file_path: str, content: str, repo_path: Optional[str] = None):
+    __slots__ = (
+        "file_path", "_file_path_str", "content", "repo_path", "nodes", "call_relationships", "_source",
+        "_top_level_nodes", "_methods_by_receiver", "_package_name", "_import_map",
+        "_current_function", "_current_caller_id", "_current_method_receiver",
+        "_current_receiver_var", "_struct_fields", "_func_signatures", "_current_scope_vars",
+        "_interface_methods", "_struct_methods", "_module_path", "_relative_path",
+    )
+
+    def __init__(
+        self,
+        file_path: str,
+        content: str,
+        repo_path: Optional[str] = None,
+        source: Optional[bytes] = None,
+    ):
         self.file_path = Path(file_path)
+        self._file_path_str = str(self.file_path)
         self.content = content or ""
         self.repo_path = repo_path or ""
         self.nodes: List[Node] = []
         self.call_relationships: List[CallRelationship] = []
+        # UTF-8 bytes of content; parsed and sliced for node source code
+        self._source: bytes = source if source is not None else self.content.encode("utf8")
         self._top_level_nodes: Dict[str, Node] = {}
+        self._methods_by_receiver: Dict[str, Dict[str, Node]] = {}  # Receiver -> {method: Node}
         self._package_name: str = ""
         self._import_map: Dict[str, str] = {}  # alias -> full package path
         self._current_function: Optional[str] = None
+        self._current_caller_id: Optional[str] = None
         self._current_method_receiver: Optional[str] = None
         self._current_receiver_var: Optional[str] = None
         # Type resolution context
-        self._struct_fields: Dict[str, Dict[str, str]] = {}  # StructName -> {field: Type}
+        self._struct_fields: Dict[Tuple[str, str], str] = {}  # (StructName, field) -> Type
         self._func_signatures: Dict[str, Dict] = {}  # func_key -> {params: {name: type}, returns: [type]}
         self._current_scope_vars: Dict[str, str] = {}  # var_name -> Type (per-function)
         self._interface_methods: Dict[str, Set[str]] = {}  # InterfaceName -> {method_name#param_count}
         self._struct_methods: Dict[str, Set[str]] = {}  # StructName -> {method_name#param_count}
+        # Fixed per file; used for every node and call site
+        self._module_path = self._get_module_path()
+        self._relative_path = self._get_relative_path()
 
         self._analyze()
 
@@ -61,30 +195,30 @@ class TreeSitterGoAnalyzer:
         """Get module path for the file (package-based)."""
         if self.repo_path:
             try:
-                rel_path = os.path.relpath(str(self.file_path), self.repo_path)
+                rel_path = os.path.relpath(self._file_path_str, self.repo_path)
             except ValueError:
-                rel_path = str(self.file_path)
+                rel_path = self._file_path_str
         else:
-            rel_path = str(self.file_path)
+            rel_path = self._file_path_str
 
         # Remove .go extension
         if rel_path.endswith('.go'):
             rel_path = rel_path[:-3]
 
-        return rel_path.replace('/', '.').replace('\\', '.')
+        return rel_path.translate(_PATH_SEPARATORS_TO_DOTS)
 
     def _get_relative_path(self) -> str:
         """Get relative path from repo root."""
         if self.repo_path:
             try:
-                return os.path.relpath(str(self.file_path), self.repo_path)
+                return os.path.relpath(self._file_path_str, self.repo_path)
             except ValueError:
-                return str(self.file_path)
-        return str(self.file_path)
+                return self._file_path_str
+        return self._file_path_str
 
     def _get_component_id(self, name: str, receiver_type: str = None) -> str:
         """Generate component ID for a node."""
-        module_path = self._get_module_path()
+        module_path = self._module_path
         if receiver_type:
             # For methods: module_path.ReceiverType.MethodName
             return f"{module_path}.{receiver_type}.{name}"
@@ -97,42 +231,66 @@ class TreeSitterGoAnalyzer:
     def _analyze(self):
         """Parse and analyze the Go file."""
         try:
-            go_lang_capsule = tree_sitter_go.language()
-            go_language = Language(go_lang_capsule)
-            parser = Parser(go_language)
+            if _GO_LANGUAGE is None or _DECLARATIONS_QUERY is None:
+                return
+            parser = _go_parser()
 
-            tree = parser.parse(bytes(self.content, "utf8"))
+            tree = parser.parse(self._source)
             root = tree.root_node
-            lines = self.content.splitlines()
+            # Declarations may sit inside ERROR nodes, so only trust a clean tree
+            if not root.has_error and not any(child.type in _DECLARATION_TYPES for child in root.children):
+                return
 
-            # First pass: extract package name and imports
-            self._extract_package_info(root)
+            # Single tree walk: package name, imports and nodes (functions,
+            # methods, types), collecting call/embedding sites on the way
+            call_sites = self._extract_declarations(root)
 
-            # Second pass: extract nodes (functions, methods, types)
-            self._extract_nodes(root, lines)
-
-            # Pass 2.5: build type context (struct fields, function signatures)
+            # Build type context (struct fields, function signatures) from
+            # the top-level declarations
             self._build_type_context(root)
 
-            # Third pass: extract call relationships (with type resolution)
-            self._extract_call_relationships(root)
+            # Resolve the collected sites once every node of the file is known
+            self._extract_call_relationships(call_sites)
 
         except Exception as e:
             logger.error(f"Error parsing Go file {self.file_path}: {e}")
 
-    def _extract_package_info(self, node):
-        """Extract package name and import statements."""
-        if node.type == "package_clause":
+    def _extract_declarations(self, root) -> List[Tuple]:
+        """
+        Extract package info, imports and nodes from one query run.
+
+        Call expressions and embedded field types are not resolved here:
+        resolution needs every node of the file, so they are returned in
+        tree order as (site, enclosing function/method declaration or None)
+        pairs.
+        """
+        captures = QueryCursor(_DECLARATIONS_QUERY).captures(root)
+
+        for node in _in_tree_order(captures.get("package", [])):
             for child in node.children:
                 if child.type == "package_identifier":
                     self._package_name = child.text.decode()
                     break
-
-        elif node.type == "import_declaration":
+        for node in _in_tree_order(captures.get("import", [])):
             self._extract_import(node)
 
-        for child in node.children:
-            self._extract_package_info(child)
+        functions = []
+        for node in _in_tree_order(captures.get("declaration", [])):
+            self._extract_node(node)
+            if node.type != "type_declaration":
+                functions.append(node)
+
+        # Function and method declarations never nest, so the enclosing one
+        # is the last that starts at or before the site, if it is still open
+        function_starts = [node.start_byte for node in functions]
+        call_sites: List[Tuple] = []
+        for node in _in_tree_order(captures.get("site", [])):
+            index = bisect.bisect_right(function_starts, node.start_byte) - 1
+            declaration = functions[index] if index >= 0 else None
+            if declaration is not None and node.end_byte > declaration.end_byte:
+                declaration = None
+            call_sites.append((node, declaration))
+        return call_sites
 
     def _extract_import(self, node):
         """Extract import statement."""
@@ -148,9 +306,10 @@ class TreeSitterGoAnalyzer:
             path = None
 
             for child in import_spec.children:
-                if child.type == "package_identifier":
+                child_type = child.type
+                if child_type == "package_identifier":
                     alias = child.text.decode()
-                elif child.type == "interpreted_string_literal":
+                elif child_type == "interpreted_string_literal":
                     # Remove quotes
                     path = child.text.decode().strip('"')
 
@@ -160,29 +319,26 @@ class TreeSitterGoAnalyzer:
                     alias = path.split('/')[-1]
                 self._import_map[alias] = path
 
-    def _extract_nodes(self, node, lines: List[str], depth: int = 0):
-        """Extract function, method, struct, interface nodes."""
-        if depth > 100:
-            return
-
+    def _extract_node(self, node):
+        """Create the Node for a single declaration, if it is one."""
         node_type = None
         node_name = None
         receiver_type = None
         docstring = ""
 
         # Get preceding docstring (Go comments)
-        docstring = self._get_preceding_docstring(node, lines)
+        docstring = self._get_preceding_docstring(node)
 
         # Function declaration: func Name()
         if node.type == "function_declaration":
             node_type = "function"
-            name_node = self._find_child_by_type(node, "identifier")
+            name_node = node.child_by_field_name("name")
             node_name = name_node.text.decode() if name_node else None
 
         # Method declaration: func (r *Receiver) Name()
         elif node.type == "method_declaration":
             node_type = "method"
-            name_node = self._find_child_by_type(node, "field_identifier")
+            name_node = node.child_by_field_name("name")
             node_name = name_node.text.decode() if name_node else None
 
             receiver_type = self._extract_method_receiver_type(node)
@@ -191,26 +347,24 @@ class TreeSitterGoAnalyzer:
         elif node.type == "type_declaration":
             for child in node.children:
                 if child.type == "type_spec":
-                    name_node = self._find_child_by_type(child, "type_identifier")
+                    name_node = child.child_by_field_name("name")
                     node_name = name_node.text.decode() if name_node else None
 
                     # Check what kind of type
-                    type_node = self._find_child_by_type(child, "struct_type")
-                    if type_node:
+                    type_node = child.child_by_field_name("type")
+                    if type_node and type_node.type == "struct_type":
                         node_type = "struct"
-                    else:
-                        type_node = self._find_child_by_type(child, "interface_type")
-                        if type_node:
-                            node_type = "interface"
+                    elif type_node and type_node.type == "interface_type":
+                        node_type = "interface"
 
                     if node_type and node_name:
-                        self._create_type_node(node_name, node_type, node, lines, docstring)
+                        self._create_type_node(node_name, node_type, node, docstring)
                     break
 
         # Create function/method node
         if node_type in ("function", "method") and node_name:
             component_id = self._get_component_id(node_name, receiver_type)
-            relative_path = self._get_relative_path()
+            relative_path = self._relative_path
 
             # Extract parameters
             parameters = self._extract_parameters(node)
@@ -222,13 +376,13 @@ class TreeSitterGoAnalyzer:
             # Safely extract source code
             start_line = node.start_point[0] if node.start_point else 0
             end_line = node.end_point[0] if node.end_point else start_line
-            source_code = "\n".join(lines[start_line:end_line+1]) if lines else ""
+            source_code = self._line_span_source(node)
 
             node_obj = Node(
                 id=component_id,
                 name=node_name,
                 component_type=node_type,
-                file_path=str(self.file_path),
+                file_path=self._file_path_str,
                 relative_path=relative_path,
                 source_code=source_code,
                 start_line=start_line + 1,
@@ -246,7 +400,7 @@ class TreeSitterGoAnalyzer:
 
             # Check return types for error
             return_types = self._extract_return_types_from_func(node)
-            if any(self._normalize_type_name(t) == "error" for t in return_types):
+            if any(_normalize_type_name(t) == "error" for t in return_types):
                 node_obj.returns_error = True
 
             # Scan function body for concurrency/error patterns
@@ -255,27 +409,31 @@ class TreeSitterGoAnalyzer:
             self.nodes.append(node_obj)
             self._top_level_nodes[node_name] = node_obj
             if receiver_type:
-                self._top_level_nodes[f"{receiver_type}.{node_name}"] = node_obj
+                self._methods_by_receiver.setdefault(receiver_type, {})[node_name] = node_obj
 
-        # Recursively process children
-        for child in node.children:
-            self._extract_nodes(child, lines, depth + 1)
+    def _line_span_source(self, node) -> str:
+        """Source of the whole lines a node spans, sliced from the parsed bytes."""
+        start = node.start_byte - node.start_point[1]
+        end = self._source.find(b"\n", node.end_byte)
+        if end < 0:
+            end = len(self._source)
+        return self._source[start:end].decode("utf8", errors="replace")
 
-    def _create_type_node(self, name: str, node_type: str, node, lines: List[str], docstring: str):
+    def _create_type_node(self, name: str, node_type: str, node, docstring: str):
         """Create a node for struct or interface type."""
         component_id = self._get_component_id(name)
-        relative_path = self._get_relative_path()
+        relative_path = self._relative_path
 
         # Safely extract source code
         start_line = node.start_point[0] if node.start_point else 0
         end_line = node.end_point[0] if node.end_point else start_line
-        source_code = "\n".join(lines[start_line:end_line+1]) if lines else ""
+        source_code = self._line_span_source(node)
 
         node_obj = Node(
             id=component_id,
             name=name,
             component_type=node_type,
-            file_path=str(self.file_path),
+            file_path=self._file_path_str,
             relative_path=relative_path,
             source_code=source_code,
             start_line=start_line + 1,
@@ -295,31 +453,22 @@ class TreeSitterGoAnalyzer:
 
     def _analyze_function_body(self, func_node, node_obj: Node):
         """Scan function body for concurrency, error handling, and control flow patterns."""
-        body = self._find_child_by_type(func_node, "block")
-        if not body:
-            return
-        self._scan_body_patterns(body, node_obj)
-
-    def _scan_body_patterns(self, node, node_obj: Node, depth: int = 0):
-        """Recursively scan AST for patterns."""
-        if depth > 50:
+        body = func_node.child_by_field_name("body")
+        if not body or _BODY_PATTERNS_QUERY is None:
             return
-        if node.type == "go_statement":
+        cursor = QueryCursor(_BODY_PATTERNS_QUERY)
+        cursor.set_max_start_depth(_BODY_SCAN_MAX_DEPTH)
+        found = cursor.captures(body)
+        if "goroutine" in found:
             node_obj.spawns_goroutines = True
-        elif node.type == "select_statement":
+        if "select" in found:
             node_obj.uses_select = True
-        elif node.type in ("send_statement", "receive_statement"):
+        if "channel" in found:
             node_obj.uses_channels = True
-        elif node.type == "defer_statement":
+        if "defer" in found:
             node_obj.has_defers = True
-        elif node.type == "call_expression":
-            func_child = node.children[0] if node.children else None
-            if func_child and func_child.type == "identifier" and func_child.text.decode() == "panic":
-                node_obj.has_panic = True
-        elif node.type == "channel_type":
-            node_obj.uses_channels = True
-        for child in node.children:
-            self._scan_body_patterns(child, node_obj, depth + 1)
+        if "panic" in found:
+            node_obj.has_panic = True
 
     # ── Type resolution infrastructure ──
 
@@ -340,48 +489,47 @@ class TreeSitterGoAnalyzer:
         for child in node.children:
             if child.type != "type_spec":
                 continue
-            name_node = self._find_child_by_type(child, "type_identifier")
-            struct_node = self._find_child_by_type(child, "struct_type")
-            if not name_node or not struct_node:
+            name_node = child.child_by_field_name("name")
+            struct_node = child.child_by_field_name("type")
+            if not name_node or not struct_node or struct_node.type != "struct_type":
                 continue
             struct_name = name_node.text.decode()
-            self._struct_fields[struct_name] = {}
             field_list = self._find_child_by_type(struct_node, "field_declaration_list")
             if not field_list:
                 continue
             for field in field_list.children:
                 if field.type != "field_declaration":
                     continue
-                names = [c.text.decode() for c in field.children if c.type == "identifier"]
+                names = []
                 type_node = None
                 for c in field.children:
-                    if c.type in ("type_identifier", "qualified_type", "pointer_type",
-                                  "slice_type", "map_type", "chan_type",
-                                  "interface_type", "function_type", "struct_type"):
+                    c_type = c.type
+                    if c_type == "identifier":
+                        names.append(c.text.decode())
+                    elif type_node is None and c_type in _FIELD_TYPE_KINDS:
                         type_node = c
-                        break
                 if type_node and names:
-                    field_type = self._normalize_type_name(type_node.text.decode())
+                    field_type = _normalize_type_name(type_node.text.decode())
                     for name in names:
-                        self._struct_fields[struct_name][name] = field_type
+                        self._struct_fields[(struct_name, name)] = field_type
 
     def _extract_interface_method_sigs(self, type_decl_node):
         """Extract method signatures from interface declarations for satisfaction checking."""
         for child in type_decl_node.children:
             if child.type != "type_spec":
                 continue
-            name_node = self._find_child_by_type(child, "type_identifier")
-            iface_node = self._find_child_by_type(child, "interface_type")
-            if not name_node or not iface_node:
+            name_node = child.child_by_field_name("name")
+            iface_node = child.child_by_field_name("type")
+            if not name_node or not iface_node or iface_node.type != "interface_type":
                 continue
             iface_name = name_node.text.decode()
             self._interface_methods[iface_name] = set()
             for spec in iface_node.children:
                 if spec.type in ("method_spec", "method_elem"):
-                    method_name_node = self._find_child_by_type(spec, "field_identifier")
+                    method_name_node = spec.child_by_field_name("name")
                     if method_name_node:
                         method_name = method_name_node.text.decode()
-                        param_list = self._find_child_by_type(spec, "parameter_list")
+                        param_list = spec.child_by_field_name("parameters")
                         param_count = 0
                         if param_list:
                             param_count = sum(1 for c in param_list.children if c.type == "parameter_declaration")
@@ -390,21 +538,21 @@ class TreeSitterGoAnalyzer:
     def _track_struct_method(self, method_node):
         """Track method for struct method set (used for interface satisfaction)."""
         receiver_type = self._extract_method_receiver_type(method_node)
-        name_node = self._find_child_by_type(method_node, "field_identifier")
+        name_node = method_node.child_by_field_name("name")
         if not receiver_type or not name_node:
             return
         if receiver_type not in self._struct_methods:
             self._struct_methods[receiver_type] = set()
         method_name = name_node.text.decode()
-        param_lists = [c for c in method_node.children if c.type == "parameter_list"]
+        param_list = method_node.child_by_field_name("parameters")
         param_count = 0
-        if len(param_lists) >= 2:
-            param_count = sum(1 for c in param_lists[1].children if c.type == "parameter_declaration")
+        if param_list:
+            param_count = sum(1 for c in param_list.children if c.type == "parameter_declaration")
         self._struct_methods[receiver_type].add(f"{method_name}#{param_count}")
 
     def _extract_func_signature(self, node):
         """Extract function parameter types and return types."""
-        name_node = self._find_child_by_type(node, "identifier")
+        name_node = node.child_by_field_name("name")
         if not name_node:
             return
         func_name = name_node.text.decode()
@@ -414,16 +562,16 @@ class TreeSitterGoAnalyzer:
 
     def _extract_method_signature(self, node):
         """Extract method parameter types and return types."""
-        name_node = self._find_child_by_type(node, "field_identifier")
+        name_node = node.child_by_field_name("name")
         receiver_type = self._extract_method_receiver_type(node)
         if not name_node:
             return
         method_name = name_node.text.decode()
         key = f"{receiver_type}.{method_name}" if receiver_type else method_name
-        param_lists = [c for c in node.children if c.type == "parameter_list"]
+        param_list = node.child_by_field_name("parameters")
         params = {}
-        if len(param_lists) >= 2:
-            for child in param_lists[1].children:
+        if param_list:
+            for child in param_list.children:
                 if child.type == "parameter_declaration":
                     p_names, p_type = self._extract_param_name_and_type(child)
                     if p_type:
@@ -435,21 +583,14 @@ class TreeSitterGoAnalyzer:
     def _extract_param_types_from_func(self, func_node) -> Dict[str, str]:
         """Extract parameter name-to-type mapping from a function node."""
         params = {}
-        start_idx = 0
-        if func_node.type == "method_declaration":
-            for i, child in enumerate(func_node.children):
-                if child.type == "parameter_list":
-                    start_idx = i + 1
-                    break
-        for child in func_node.children[start_idx:]:
-            if child.type == "parameter_list":
-                for param in child.children:
-                    if param.type == "parameter_declaration":
-                        p_names, p_type = self._extract_param_name_and_type(param)
-                        if p_type:
-                            for pn in p_names:
-                                params[pn] = p_type
-                break
+        param_list = func_node.child_by_field_name("parameters")
+        if param_list:
+            for param in param_list.children:
+                if param.type == "parameter_declaration":
+                    p_names, p_type = self._extract_param_name_and_type(param)
+                    if p_type:
+                        for pn in p_names:
+                            params[pn] = p_type
         return params
 
     def _extract_param_name_and_type(self, param_node) -> Tuple[List[str], Optional[str]]:
@@ -457,47 +598,38 @@ class TreeSitterGoAnalyzer:
         names = []
         param_type = None
         for child in param_node.children:
-            if child.type == "identifier":
+            child_type = child.type
+            if child_type == "identifier":
                 names.append(child.text.decode())
-            elif child.type in ("type_identifier", "qualified_type", "pointer_type",
-                                "slice_type", "map_type", "chan_type", "interface_type"):
-                param_type = self._normalize_type_name(child.text.decode())
+            elif child_type in _PARAM_TYPE_KINDS:
+                param_type = _normalize_type_name(child.text.decode())
         return names, param_type
 
     def _extract_return_types_from_func(self, func_node) -> List[str]:
         """Extract return types from a function/method declaration."""
         types = []
-        param_lists = [i for i, c in enumerate(func_node.children) if c.type == "parameter_list"]
+        children = func_node.children
+        param_lists = [i for i, c in enumerate(children) if c.type == "parameter_list"]
         if not param_lists:
             return types
         last_param_idx = param_lists[-1]
-        for child in func_node.children[last_param_idx + 1:]:
-            if child.type == "block":
+        for child in children[last_param_idx + 1:]:
+            child_type = child.type
+            if child_type == "block":
                 break
-            if child.type in ("type_identifier", "qualified_type", "pointer_type",
-                              "slice_type", "map_type"):
-                types.append(self._normalize_type_name(child.text.decode()))
-            elif child.type == "parameter_list":
+            if child_type in _DECLARED_TYPE_KINDS:
+                types.append(_normalize_type_name(child.text.decode()))
+            elif child_type == "parameter_list":
                 for pc in child.children:
-                    if pc.type == "parameter_declaration":
+                    pc_type = pc.type
+                    if pc_type == "parameter_declaration":
                         for pcc in pc.children:
-                            if pcc.type in ("type_identifier", "qualified_type", "pointer_type"):
-                                types.append(self._normalize_type_name(pcc.text.decode()))
-                    elif pc.type in ("type_identifier", "qualified_type", "pointer_type"):
-                        types.append(self._normalize_type_name(pc.text.decode()))
+                            if pcc.type in _NAMED_TYPE_KINDS:
+                                types.append(_normalize_type_name(pcc.text.decode()))
+                    elif pc_type in _NAMED_TYPE_KINDS:
+                        types.append(_normalize_type_name(pc.text.decode()))
         return types
 
-    def _normalize_type_name(self, type_text: str) -> str:
-        """Normalize a Go type to its base type name (strip *, [], package prefix)."""
-        t = type_text.strip()
-        while t.startswith("*"):
-            t = t[1:].strip()
-        while t.startswith("[]"):
-            t = t[2:].strip()
-        if "." in t:
-            t = t.split(".")[-1]
-        return t
-
     def _build_function_scope(self, func_node):
         """Build variable type scope for a function/method body."""
         self._current_scope_vars = {}
@@ -513,31 +645,21 @@ class TreeSitterGoAnalyzer:
         if self._current_receiver_var and self._current_method_receiver:
             self._current_scope_vars[self._current_receiver_var] = self._current_method_receiver
         # Walk body for variable declarations
-        body = self._find_child_by_type(func_node, "block")
-        if body:
-            self._walk_for_var_types(body)
-
-    def _walk_for_var_types(self, node, depth: int = 0):
-        """Walk AST nodes to find variable declarations and infer their types."""
-        if depth > 50:
-            return
-        if node.type == "short_var_declaration":
-            self._process_short_var_decl(node)
-        elif node.type == "var_declaration":
-            self._process_var_decl(node)
-        for child in node.children:
-            self._walk_for_var_types(child, depth + 1)
+        body = func_node.child_by_field_name("body")
+        if body and _VAR_DECLARATIONS_QUERY is not None:
+            cursor = QueryCursor(_VAR_DECLARATIONS_QUERY)
+            cursor.set_max_start_depth(_BODY_SCAN_MAX_DEPTH)
+            # Later declarations shadow earlier ones, so keep source order
+            for node in _in_tree_order(cursor.captures(body).get("declaration", [])):
+                if node.type == "short_var_declaration":
+                    self._process_short_var_decl(node)
+                else:
+                    self._process_var_decl(node)
 
     def _process_short_var_decl(self, node):
         """Process `x := expr` to extract variable types."""
-        left = None
-        right = None
-        for child in node.children:
-            if child.type == "expression_list":
-                if left is None:
-                    left = child
-                else:
-                    right = child
+        left = node.child_by_field_name("left")
+        right = node.child_by_field_name("right")
         if not left or not right:
             return
         left_names = [c.text.decode() for c in left.children if c.type == "identifier"]
@@ -556,38 +678,38 @@ class TreeSitterGoAnalyzer:
             names = []
             var_type = None
             for c in child.children:
-                if c.type == "identifier":
+                c_type = c.type
+                if c_type == "identifier":
                     names.append(c.text.decode())
-                elif c.type in ("type_identifier", "qualified_type", "pointer_type",
-                                "slice_type", "map_type"):
-                    var_type = self._normalize_type_name(c.text.decode())
+                elif c_type in _DECLARED_TYPE_KINDS:
+                    var_type = _normalize_type_name(c.text.decode())
             if var_type:
                 for name in names:
                     self._current_scope_vars[name] = var_type
 
     def _infer_type_from_expr(self, expr) -> Optional[str]:
         """Infer type from a single expression (composite literal, &T{}, call, type assertion)."""
+        expr_type = expr.type
         # Composite literal: Type{...}
-        if expr.type == "composite_literal":
-            type_node = expr.children[0] if expr.children else None
-            if type_node and type_node.type in ("type_identifier", "qualified_type"):
-                return self._normalize_type_name(type_node.text.decode())
+        if expr_type == "composite_literal":
+            type_node = expr.child(0)
+            if type_node and type_node.type in _LITERAL_TYPE_KINDS:
+                return _normalize_type_name(type_node.text.decode())
         # Address-of composite: &Type{...}
-        if expr.type == "unary_expression" and len(expr.children) >= 2:
-            if expr.children[0].type == "&":
-                inner = expr.children[1]
-                if inner.type == "composite_literal" and inner.children:
-                    type_node = inner.children[0]
-                    if type_node.type in ("type_identifier", "qualified_type"):
-                        return self._normalize_type_name(type_node.text.decode())
+        if expr_type == "unary_expression" and expr.child_count >= 2:
+            if expr.child(0).type == "&":
+                inner = expr.child(1)
+                type_node = inner.child(0) if inner.type == "composite_literal" else None
+                if type_node and type_node.type in _LITERAL_TYPE_KINDS:
+                    return _normalize_type_name(type_node.text.decode())
         # Call expression: NewService() or pkg.New()
-        if expr.type == "call_expression" and expr.children:
-            func_node = expr.children[0]
+        func_node = expr.child(0) if expr_type == "call_expression" else None
+        if func_node:
             func_name = None
             if func_node.type == "identifier":
                 func_name = func_node.text.decode()
             elif func_node.type == "selector_expression":
-                field = self._find_child_by_type(func_node, "field_identifier")
+                field = func_node.child_by_field_name("field")
                 if field:
                     func_name = field.text.decode()
             if func_name:
@@ -598,10 +720,10 @@ class TreeSitterGoAnalyzer:
                 if func_name.startswith("New") and len(func_name) > 3:
                     return func_name[3:]
         # Type assertion: x.(Type)
-        if expr.type == "type_assertion_expression":
+        if expr_type == "type_assertion_expression":
             for child in expr.children:
-                if child.type in ("type_identifier", "qualified_type", "pointer_type"):
-                    return self._normalize_type_name(child.text.decode())
+                if child.type in _NAMED_TYPE_KINDS:
+                    return _normalize_type_name(child.text.decode())
         return None
 
     def _resolve_receiver_type(self, var_name: str) -> Optional[str]:
@@ -610,23 +732,13 @@ class TreeSitterGoAnalyzer:
         if var_name in self._current_scope_vars:
             return self._current_scope_vars[var_name]
         # 2. Check struct fields for method receiver access (e.g., h.svc in func (h *Handler))
-        if self._current_method_receiver and self._current_method_receiver in self._struct_fields:
-            fields = self._struct_fields[self._current_method_receiver]
-            if var_name in fields:
-                return fields[var_name]
+        if self._current_method_receiver:
+            return self._struct_fields.get((self._current_method_receiver, var_name))
         return None
 
     def _resolve_selector_chain_type(self, selector_node) -> Optional[str]:
         """Resolve chained selector like h.svc to its final type for h.svc.DoWork()."""
-        parts = []
-        current = selector_node
-        while current and current.type == "selector_expression":
-            field = self._find_child_by_type(current, "field_identifier")
-            if field:
-                parts.insert(0, field.text.decode())
-                current = current.children[0]
-            else:
-                break
+        current, parts = self._split_selector(selector_node)
         if not (current and current.type == "identifier"):
             return None
         root_var = current.text.decode()
@@ -635,19 +747,14 @@ class TreeSitterGoAnalyzer:
             return None
         # Chain through struct fields: h -> Handler, .svc -> Service, etc.
         for field_name in parts:
-            if current_type in self._struct_fields:
-                field_type = self._struct_fields[current_type].get(field_name)
-                if field_type:
-                    current_type = field_type
-                else:
-                    return None
-            else:
+            current_type = self._struct_fields.get((current_type, field_name))
+            if not current_type:
                 return None
         return current_type
 
     def _extract_receiver_var_name(self, method_node) -> Optional[str]:
         """Extract the receiver variable name (e.g., 'h' from 'func (h *Handler)')."""
-        receiver_node = self._find_child_by_type(method_node, "parameter_list")
+        receiver_node = method_node.child_by_field_name("receiver")
         if not receiver_node:
             return None
         for child in receiver_node.children:
@@ -657,14 +764,30 @@ class TreeSitterGoAnalyzer:
                         return c.text.decode()
         return None
 
-    def _extract_call_relationships(self, node, depth: int = 0):
-        """Extract function call relationships."""
-        if depth > 100:
-            return
+    def _extract_call_relationships(self, call_sites: List[Tuple]):
+        """Extract call and embedding relationships from the collected sites."""
+        current = None
+        for node, declaration in call_sites:
+            if declaration is not current:
+                self._leave_function()
+                if declaration is not None:
+                    self._enter_function(declaration)
+                current = declaration
+
+            # Handle call expressions
+            if node.type == "call_expression":
+                self._process_call_expression(node)
+
+            # Handle struct/interface embedding (inheritance-like)
+            else:
+                self._process_embedding(node)
+
+        self._leave_function()
 
-        # Track current function context and build variable type scope
+    def _enter_function(self, node):
+        """Set the current function context and build its variable type scope."""
         if node.type == "function_declaration":
-            name_node = self._find_child_by_type(node, "identifier")
+            name_node = node.child_by_field_name("name")
             if name_node:
                 self._current_function = name_node.text.decode()
                 self._current_method_receiver = None
@@ -672,35 +795,26 @@ class TreeSitterGoAnalyzer:
                 self._build_function_scope(node)
 
         elif node.type == "method_declaration":
-            name_node = self._find_child_by_type(node, "field_identifier")
+            name_node = node.child_by_field_name("name")
             if name_node:
                 self._current_function = name_node.text.decode()
                 self._current_method_receiver = self._extract_method_receiver_type(node)
                 self._current_receiver_var = self._extract_receiver_var_name(node)
                 self._build_function_scope(node)
 
-        # Handle call expressions
-        if node.type == "call_expression":
-            self._process_call_expression(node)
-
-        # Handle struct embedding (inheritance-like)
-        elif node.type == "struct_type":
-            self._process_struct_embedding(node)
-
-        # Handle interface embedding
-        elif node.type == "interface_type":
-            self._process_interface_embedding(node)
-
-        # Recursively process children
-        for child in node.children:
-            self._extract_call_relationships(child, depth + 1)
+        if self._current_function:
+            self._current_caller_id = self._get_component_id(
+                self._current_function,
+                self._current_method_receiver
+            )
 
-        # Reset context when leaving function
-        if node.type in ("function_declaration", "method_declaration"):
-            self._current_function = None
-            self._current_method_receiver = None
-            self._current_receiver_var = None
-            self._current_scope_vars = {}
+    def _leave_function(self):
+        """Reset function context once a declaration's subtree is done."""
+        self._current_function = None
+        self._current_caller_id = None
+        self._current_method_receiver = None
+        self._current_receiver_var = None
+        self._current_scope_vars = {}
 
     def _process_call_expression(self, node):
         """Process a call expression and extract the callee."""
@@ -708,7 +822,7 @@ class TreeSitterGoAnalyzer:
             return
 
         # Get the function/method being called
-        func_node = node.children[0] if node.children else None
+        func_node = node.child(0)
         if not func_node:
             return
 
@@ -721,8 +835,8 @@ class TreeSitterGoAnalyzer:
 
         # Method call: receiver.Method() or pkg.Func()
         elif func_node.type == "selector_expression":
-            operand = func_node.children[0] if func_node.children else None
-            field = self._find_child_by_type(func_node, "field_identifier")
+            operand = func_node.child_by_field_name("operand")
+            field = func_node.child_by_field_name("field")
 
             if field:
                 callee_name = field.text.decode()
@@ -749,111 +863,84 @@ class TreeSitterGoAnalyzer:
         if not callee_name or self._is_builtin(callee_name):
             return
 
-        caller_id = self._get_component_id(
-            self._current_function,
-            self._current_method_receiver
-        )
-
         # Build callee ID using type-resolved receiver
-        callee_id = callee_name
-        is_resolved = False
         if receiver_type:
-            short_key = f"{receiver_type}.{callee_name}"
-            if short_key in self._top_level_nodes:
-                callee_id = self._top_level_nodes[short_key].id
-                is_resolved = True
-            else:
-                callee_id = short_key
+            callee = self._methods_by_receiver.get(receiver_type, _NO_METHODS).get(callee_name)
+            if callee is None:
+                callee_id = sys.intern(f"{receiver_type}.{callee_name}")
         else:
-            if callee_name in self._top_level_nodes:
-                callee_id = self._top_level_nodes[callee_name].id
-                is_resolved = True
+            callee = self._top_level_nodes.get(callee_name)
+            if callee is None:
+                # Unresolved chains like getg().buf.flush() still name "buf.flush"
+                receiver, _, method = callee_name.partition(".")
+                if method and "." not in method:
+                    callee = self._methods_by_receiver.get(receiver, _NO_METHODS).get(method)
+            if callee is None:
+                callee_id = sys.intern(callee_name)
+        is_resolved = callee is not None
+        if is_resolved:
+            callee_id = callee.id
 
         self.call_relationships.append(CallRelationship(
-            caller=caller_id,
+            caller=self._current_caller_id,
             callee=callee_id,
             call_line=node.start_point[0] + 1,
             is_resolved=is_resolved
         ))
 
-    def _process_struct_embedding(self, node):
-        """Process struct type for embedded structs (inheritance-like)."""
-        containing_type = self._find_containing_type_name(node)
+    def _process_embedding(self, type_node):
+        """Record the type of an unnamed struct field or interface element as embedded."""
+        # field_declaration -> field_declaration_list -> struct_type, or
+        # method_elem -> interface_type
+        owner = type_node.parent.parent
+        if owner.type == "field_declaration_list":
+            owner = owner.parent
+        containing_type = self._find_containing_type_name(owner)
         if not containing_type:
             return
 
-        for child in node.children:
-            if child.type == "field_declaration_list":
-                for field in child.children:
-                    if field.type == "field_declaration":
-                        # Embedded struct: just a type, no name
-                        names = [c for c in field.children if c.type == "identifier"]
-                        types = [c for c in field.children if c.type == "type_identifier"]
-
-                        # If no name but has type, it's embedded
-                        if types and not names:
-                            embedded_type = types[0].text.decode()
-                            if not self._is_primitive(embedded_type):
-                                caller_id = self._get_component_id(containing_type)
-                                self.call_relationships.append(CallRelationship(
-                                    caller=caller_id,
-                                    callee=embedded_type,
-                                    call_line=node.start_point[0] + 1,
-                                    is_resolved=False,
-                                    relationship_type="embeds"
-                                ))
-
-    def _process_interface_embedding(self, node):
-        """Process interface type for embedded interfaces."""
-        containing_type = self._find_containing_type_name(node)
-        if not containing_type:
-            return
-
-        for child in node.children:
-            if child.type in ("method_spec", "method_elem"):
-                # Check if it's just a type (embedded interface)
-                has_name = any(c.type == "field_identifier" for c in child.children)
-                type_ids = [c for c in child.children if c.type == "type_identifier"]
-
-                if type_ids and not has_name:
-                    embedded_type = type_ids[0].text.decode()
-                    if not self._is_primitive(embedded_type):
-                        caller_id = self._get_component_id(containing_type)
-                        self.call_relationships.append(CallRelationship(
-                            caller=caller_id,
-                            callee=embedded_type,
-                            call_line=node.start_point[0] + 1,
-                            is_resolved=False,
-                            relationship_type="embeds"
-                        ))
+        embedded_type = type_node.text.decode()
+        if not self._is_primitive(embedded_type):
+            caller_id = self._get_component_id(containing_type)
+            self.call_relationships.append(CallRelationship(
+                caller=caller_id,
+                callee=embedded_type,
+                call_line=owner.start_point[0] + 1,
+                is_resolved=False,
+                relationship_type="embeds"
+            ))
 
     def _find_containing_type_name(self, node) -> Optional[str]:
         """Find the containing struct/interface name."""
         current = node.parent
         while current:
             if current.type == "type_spec":
-                name_node = self._find_child_by_type(current, "type_identifier")
+                name_node = current.child_by_field_name("name")
                 return name_node.text.decode() if name_node else None
             current = current.parent
         return None
 
     def _get_full_selector_name(self, node) -> str:
         """Get full name from a selector expression."""
-        parts = []
-        current = node
-        while current and current.type == "selector_expression":
-            field = self._find_child_by_type(current, "field_identifier")
-            if field:
-                parts.insert(0, field.text.decode())
-                current = current.children[0]
-            else:
-                break
-
+        current, parts = self._split_selector(node)
         if current and current.type == "identifier":
             parts.insert(0, current.text.decode())
 
         return ".".join(parts)
 
+    def _split_selector(self, node) -> Tuple[Any, List[str]]:
+        """Split a.b.c into its innermost operand and the field names in source order."""
+        parts = []
+        current = node
+        while current and current.type == "selector_expression":
+            field = current.child_by_field_name("field")
+            if not field:
+                break
+            parts.append(field.text.decode())
+            current = current.child_by_field_name("operand")
+        parts.reverse()
+        return current, parts
+
     def _find_child_by_type(self, node, child_type: str):
         """Find first child of a specific type."""
         for child in node.children:
@@ -863,7 +950,7 @@ class TreeSitterGoAnalyzer:
 
     def _extract_method_receiver_type(self, method_node) -> Optional[str]:
         """Extract receiver type from a method declaration, including pointer receivers."""
-        receiver_node = self._find_child_by_type(method_node, "parameter_list")
+        receiver_node = method_node.child_by_field_name("receiver")
         if not receiver_node:
             return None
 
@@ -920,47 +1007,45 @@ class TreeSitterGoAnalyzer:
             type_text = type_text.split(".")[-1]
 
         type_text = type_text.strip().strip(",")
-        return type_text or None
-
-    def _get_preceding_docstring(self, node, lines: List[str]) -> str:
-        """Extract Go comment preceding a node."""
-        if node.start_point[0] == 0:
-            return ""
-
-        # Check lines directly before the node
-        start_line = node.start_point[0]
+        # Shared by every method of the receiver and pickled once per file
+        return sys.intern(type_text) if type_text else None
+
+    def _get_preceding_docstring(self, node) -> str:
+        """Extract the block of // comment nodes directly preceding a node."""
+        # Only comments on lines 1..19 above the node, and never on the first line
+        first_line = max(0, node.start_point[0] - 20) + 1
+        expected_line = None
         doc_lines = []
 
-        for i in range(start_line - 1, max(0, start_line - 20), -1):
-            if i >= len(lines):
-                continue
-            line = lines[i].strip()
-
-            if line.startswith("//"):
-                doc_lines.insert(0, line[2:].strip())
-            elif line == "":
-                if doc_lines:
-                    break  # End of comment block
-            else:
-                break  # Non-comment, non-empty line
-
-        return "\n".join(doc_lines) if doc_lines else ""
+        comment = node.prev_sibling
+        # A local type opening a statement list comes after the list's comments
+        parent = node.parent
+        while comment is None and parent is not None and parent.start_byte == node.start_byte:
+            comment = parent.prev_sibling
+            parent = parent.parent
+        while comment is not None and comment.type == "comment":
+            line, column = comment.start_point
+            if line < first_line or (expected_line is not None and line != expected_line):
+                break  # Outside the window, or a blank line ends the block
+            text = comment.text.decode()
+            line_start = self._source[comment.start_byte - column:comment.start_byte]
+            if not text.startswith("//") or line_start.decode("utf8", errors="replace").strip():
+                break  # Block comment, or trailing comment after code
+            doc_lines.append(text[2:].strip())
+            expected_line = line - 1
+            comment = comment.prev_sibling
+
+        doc_lines.reverse()
+        return "\n".join(doc_lines)
 
     def _extract_parameters(self, node) -> Optional[List[str]]:
         """Extract function/method parameters."""
         params = []
 
-        # For methods, skip the receiver parameter list
-        start_idx = 0
-        if node.type == "method_declaration":
-            for i, child in enumerate(node.children):
-                if child.type == "parameter_list":
-                    start_idx = i + 1
-                    break
-
-        # Find the main parameter list
-        for child in node.children[start_idx:]:
-            if child.type == "parameter_list":
+        # The receiver has its own field; named results are listed too
+        param_lists = [node.child_by_field_name("parameters"), node.child_by_field_name("result")]
+        for child in param_lists:
+            if child and child.type == "parameter_list":
                 for param in child.children:
                     if param.type == "parameter_declaration":
                         # Get parameter names
@@ -968,11 +1053,10 @@ class TreeSitterGoAnalyzer:
                         param_type = None
 
                         for pchild in param.children:
-                            if pchild.type == "identifier":
+                            pchild_type = pchild.type
+                            if pchild_type == "identifier":
                                 names.append(pchild.text.decode())
-                            elif pchild.type in ("type_identifier", "qualified_type",
-                                                  "pointer_type", "slice_type", "map_type",
-                                                  "chan_type"):
+                            elif pchild_type in _SIGNATURE_TYPE_KINDS:
                                 param_type = pchild.text.decode()
 
                         for name in names:
@@ -987,10 +1071,10 @@ class TreeSitterGoAnalyzer:
         """Check if type is a Go primitive or built-in."""
         if not type_name:
             return True
-        # Remove pointer prefix
-        clean_name = type_name.lstrip("*").lstrip("[]").lstrip("map[").split("]")[0]
-        clean_name = clean_name.split(".")[0]  # Handle pkg.Type
-        return clean_name.lower() in {p.lower() for p in GO_PRIMITIVES}
+        # Strip pointer/slice/map prefixes; for pkg.Type check the type name
+        match = _CLEAN_TYPE_RE.match(type_name)
+        base_name = (match.group(2) or match.group(1)) if match else type_name
+        return base_name.lower() in _GO_PRIMITIVES_LOWER
 
     def _is_builtin(self, name: str) -> bool:
         """Check if name is a Go built-in function."""
@@ -1001,7 +1085,12 @@ class TreeSitterGoAnalyzer:
         return base_name in GO_BUILTINS
 
 
-def analyze_go_file(file_path: str, content: str, repo_path: str = None) -> Tuple[List[Node], List[CallRelationship], Dict[str, Set[str]], Dict[str, Set[str]]]:
+def analyze_go_file(
+    file_path: str,
+    content: str,
+    repo_path: str = None,
+    source: Optional[bytes] = None,
+) -> Tuple[List[Node], List[CallRelationship], Dict[str, Set[str]], Dict[str, Set[str]]]:
     """
     Analyze a Go file and extract nodes, call relationships, and type information.
 
@@ -1009,9 +1098,10 @@ def analyze_go_file(file_path: str, content: str, repo_path: str = None) -> Tupl
         file_path: Path to the Go file
         content: Content of the Go file
         repo_path: Optional path to the repository root
+        source: Optional UTF-8 bytes of content, parsed as-is instead of re-encoding
 
     Returns:
         Tuple of (nodes, call_relationships, interface_methods, struct_methods)
     """
-    analyzer = TreeSitterGoAnalyzer(file_path, content, repo_path)
+    analyzer = TreeSitterGoAnalyzer(file_path, content, repo_path, source)
     return analyzer.nodes, analyzer.call_relationships, analyzer._interface_methods, analyzer._struct_methods
@@ -1,6 +1,5 @@
 import logging
 import os
-import traceback
 from typing import List, Set, Optional, Tuple
 from pathlib import Path
 import sys
@@ -33,8 +32,7 @@ class TreeSitterJSAnalyzer:
             self.parser = Parser(self.js_language)
 
         except Exception as e:
-            logger.error(f"Failed to initialize JavaScript parser: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error(f"Failed to initialize JavaScript parser: {e}", exc_info=True)
             self.parser = None
             self.js_language = None
 
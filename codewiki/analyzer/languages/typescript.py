@@ -1,6 +1,5 @@
 import logging
 import os
-import traceback
 from typing import List, Set, Optional, Tuple
 from pathlib import Path
 import sys
@@ -31,8 +30,7 @@ class TreeSitterTSAnalyzer:
             self.parser = Parser(self.ts_language)
 
         except Exception as e:
-            logger.error(f"Failed to initialize TypeScript parser: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error(f"Failed to initialize TypeScript parser: {e}", exc_info=True)
             self.parser = None
             self.ts_language = None
 
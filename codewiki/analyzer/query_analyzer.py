@@ -116,10 +116,14 @@ def analyze_file_with_queries(
     file_path,
     content: str,
     repo_path: str,
+    source: Optional[bytes] = None,
 ) -> Optional[Tuple[List[Node], List[CallRelationship]]]:
     """
     Analyze a file using tree-sitter queries.
 
+    source may carry the UTF-8 bytes of content when the caller already has
+    them, saving a re-encode before parsing.
+
     Returns (nodes, relationships) or None if the language query is unavailable.
     """
     parser = _get_parser(language)
@@ -129,7 +133,7 @@ def analyze_file_with_queries(
         return None
 
     try:
-        tree = parser.parse(content.encode())
+        tree = parser.parse(source if source is not None else content.encode())
     except Exception as e:
         logger.warning(f"Failed to parse {file_path}: {e}")
         return None
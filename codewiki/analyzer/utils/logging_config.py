@@ -26,6 +26,7 @@ Usage:
 
 import logging
 import sys
+from typing import Dict
 from colorama import Fore, Style, init
 
 # Initialize colorama for cross-platform colored terminal output
@@ -84,13 +85,18 @@ class ColoredFormatter(logging.Formatter):
         return log_line
 
 
-def setup_logging(level=logging.INFO):
-    """
-    Set up logging configuration with colored output.
-    
-    Args:
-        level: Logging level (default: logging.INFO)
-    """
+# Console handlers installed by this module, keyed by logger name. Repeat
+# setup calls reuse them instead of rebuilding handler and formatter.
+_installed_handlers: Dict[str, logging.Handler] = {}
+
+
+def _install_console_handler(logger: logging.Logger, level) -> logging.Handler:
+    """Attach a colored console handler to ``logger``, reusing one from a previous call."""
+    console_handler = _installed_handlers.get(logger.name)
+    if console_handler is not None and console_handler in logger.handlers:
+        console_handler.setLevel(level)
+        return console_handler
+
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
@@ -99,15 +105,28 @@ def setup_logging(level=logging.INFO):
     colored_formatter = ColoredFormatter()
     console_handler.setFormatter(colored_formatter)
     
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(level)
-    
     # Remove existing handlers to avoid duplicates
-    root_logger.handlers.clear()
+    logger.handlers.clear()
     
     # Add our console handler
-    root_logger.addHandler(console_handler)
+    logger.addHandler(console_handler)
+    _installed_handlers[logger.name] = console_handler
+    return console_handler
+
+
+def setup_logging(level=logging.INFO):
+    """
+    Set up logging configuration with colored output.
+    
+    Safe to call repeatedly: later calls only update the level.
+    
+    Args:
+        level: Logging level (default: logging.INFO)
+    """
+    # Configure root logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    _install_console_handler(root_logger, level)
 
 
 def setup_module_logging(module_name: str, level=logging.INFO):
@@ -120,24 +139,9 @@ def setup_module_logging(module_name: str, level=logging.INFO):
     """
     logger = logging.getLogger(module_name)
     logger.setLevel(level)
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    
-    # Set colored formatter
-    colored_formatter = ColoredFormatter()
-    console_handler.setFormatter(colored_formatter)
-    
-    # Remove existing handlers
-    logger.handlers.clear()
-    
-    # Add console handler
-    logger.addHandler(console_handler)
+    _install_console_handler(logger, level)
     
     # Prevent propagation to avoid duplicate logs
     logger.propagate = False
     
     return logger
-
-
@@ -1,28 +1,32 @@
-from pathlib import Path
+from functools import lru_cache
 import os
 
-def _inside(base: Path, target: Path) -> bool:
-    base_r = base.resolve()
-    try:
-        target_r = target.resolve()
-        return target_r.is_relative_to(base_r)  # py>=3.9
-    except AttributeError:
-        return str(target.resolve()).startswith(str(base_r))
+StrPath = str | os.PathLike
+
+@lru_cache(maxsize=32)
+def _resolved_base(base: str) -> str:
+    # The repo root is checked once per file; resolve it once per process
+    return os.path.realpath(base)
+
+def _inside(base: StrPath, target: StrPath) -> bool:
+    base_r = _resolved_base(os.fspath(base))
+    target_r = os.path.realpath(target)
+    return target_r == base_r or target_r.startswith(base_r.rstrip(os.sep) + os.sep)
 
-def assert_safe_path(base_dir: Path, target: Path):
+def assert_safe_path(base_dir: StrPath, target: StrPath):
     # Block symlinks (file or dir)
-    if target.is_symlink():
+    if os.path.islink(target):
         raise PermissionError(f"Symlink blocked: {target}")
     # Block paths that escape repo
     if not _inside(base_dir, target):
-        raise PermissionError(f"Path escapes repo: {target} -> {target.resolve()}")
+        raise PermissionError(f"Path escapes repo: {target} -> {os.path.realpath(target)}")
 
-def safe_open_text(base_dir: Path, target: Path, encoding="utf-8"):
+def safe_open_text(base_dir: StrPath, target: StrPath, encoding="utf-8"):
     assert_safe_path(base_dir, target)
     flags = os.O_RDONLY
     if hasattr(os, "O_NOFOLLOW"):
         flags |= os.O_NOFOLLOW
-    fd = os.open(str(target), flags)
+    fd = os.open(target, flags)
     try:
         with os.fdopen(fd, "r", encoding=encoding, errors="replace") as f:
             return f.read()
@@ -31,3 +35,17 @@ def safe_open_text(base_dir: Path, target: Path, encoding="utf-8"):
             os.close(fd)
         except OSError:
             pass
+
+def safe_open_bytes(base_dir: StrPath, target: StrPath) -> bytes:
+    assert_safe_path(base_dir, target)
+    flags = os.O_RDONLY
+    if hasattr(os, "O_NOFOLLOW"):
+        flags |= os.O_NOFOLLOW
+    fd = os.open(target, flags)
+    try:
+        f = os.fdopen(fd, "rb")
+    except BaseException:
+        os.close(fd)
+        raise
+    with f:
+        return f.read()
@@ -20,8 +20,11 @@ from codewiki.config import Config
 @click.option("--include", "-i", type=str, default=None, help="Comma-separated file patterns to include (e.g., '*.cs,*.py')")
 @click.option("--exclude", "-e", type=str, default=None, help="Comma-separated patterns to exclude (e.g., '*Tests*,test_*')")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed progress")
+@click.option("--no-cache", is_flag=True, help="Analyze every file without the persistent analysis cache")
 @click.pass_context
-def generate_command(ctx, output: str, include: Optional[str], exclude: Optional[str], verbose: bool):
+def generate_command(
+    ctx, output: str, include: Optional[str], exclude: Optional[str], verbose: bool, no_cache: bool
+):
     """
     Run static analysis on the current repository.
 
@@ -34,6 +37,7 @@ def generate_command(ctx, output: str, include: Optional[str], exclude: Optional
     $ codewiki generate
     $ codewiki generate -o analysis_output
     $ codewiki generate --include "*.cs" --exclude "*Tests*"
+    $ codewiki generate --no-cache
     """
     logger = create_logger(verbose=verbose)
     start_time = time.time()
@@ -71,6 +75,7 @@ def generate_command(ctx, output: str, include: Optional[str], exclude: Optional
             output_dir=str(output_dir),
             include_patterns=include_patterns,
             exclude_patterns=exclude_patterns,
+            use_analysis_cache=not no_cache,
         )
 
         # Step 3: Run static analysis
@@ -4,6 +4,9 @@ import os
 
 # Constants
 DEPENDENCY_GRAPHS_DIR = 'dependency_graphs'
+ANALYSIS_CACHE_FILE = 'analysis_cache.sqlite3'
+# Per-user cache location, outside the analyzed repository and the output dir
+ANALYSIS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.codewiki', 'cache')
 
 @dataclass
 class Config:
@@ -13,6 +16,7 @@ class Config:
     dependency_graph_dir: str
     include_patterns: Optional[List[str]] = None
     exclude_patterns: Optional[List[str]] = None
+    analysis_cache_path: Optional[str] = None
 
     @classmethod
     def from_cli(
@@ -21,6 +25,7 @@ class Config:
         output_dir: str,
         include_patterns: Optional[List[str]] = None,
         exclude_patterns: Optional[List[str]] = None,
+        use_analysis_cache: bool = True,
     ) -> 'Config':
         return cls(
             repo_path=repo_path,
@@ -28,4 +33,7 @@ class Config:
             dependency_graph_dir=os.path.join(output_dir, DEPENDENCY_GRAPHS_DIR),
             include_patterns=include_patterns,
             exclude_patterns=exclude_patterns,
+            analysis_cache_path=(
+                os.path.join(ANALYSIS_CACHE_DIR, ANALYSIS_CACHE_FILE) if use_analysis_cache else None
+            ),
         )
@@ -4,7 +4,10 @@ Architectural rule validation.
 Configurable rules for detecting structural issues in the codebase,
 inspired by dependency-cruiser and SonarQube.
 """
+import heapq
 import logging
+from collections import defaultdict
+from operator import itemgetter
 from typing import Dict, List, Any
 from codewiki.analyzer.models.core import Node
 
@@ -39,59 +42,85 @@ def evaluate_rules(
                 "components": list(cycle)[:10],
             })
 
-    # Rule 2: God components (very high fan-in + high complexity)
+    # Rules 2-5 and the Rule 7 candidates are collected in a single pass over
+    # the components. Each rule keeps its own bucket so the report order stays
+    # rule-by-rule.
+    god_components = []
+    unstable_hubs = []
+    low_maintainability = []
+    high_cognitive = []
+    bc_values = []
+
     for comp_id, node in components.items():
-        if node.fan_in >= 10 and node.complexity_score > 70:
-            violations.append({
+        name = node.name
+        fan_in = node.fan_in
+        cc = node.cyclomatic_complexity
+        mi = node.maintainability_index
+        cognitive = node.cognitive_complexity
+        bc = node.betweenness_centrality
+
+        # Rule 2: God components (very high fan-in + high complexity)
+        if fan_in >= 10 and node.complexity_score > 70:
+            god_components.append({
                 "rule": "no-god-components",
                 "severity": "high",
-                "message": f"{node.name}: fan-in={node.fan_in}, complexity={node.complexity_score:.1f} — likely doing too much",
+                "message": f"{name}: fan-in={fan_in}, complexity={node.complexity_score:.1f} — likely doing too much",
                 "components": [comp_id],
             })
 
-    # Rule 3: Highly unstable hubs (hub + instability > 0.8)
-    for comp_id, node in components.items():
+        # Rule 3: Highly unstable hubs (hub + instability > 0.8)
         if node.is_hub and node.instability > 0.8:
-            violations.append({
+            unstable_hubs.append({
                 "rule": "no-unstable-hubs",
                 "severity": "medium",
-                "message": f"{node.name}: hub with instability={node.instability:.2f} — changes here cascade widely",
+                "message": f"{name}: hub with instability={node.instability:.2f} — changes here cascade widely",
                 "components": [comp_id],
             })
 
-    # Rule 4: Low maintainability (MI < 20)
-    for comp_id, node in components.items():
-        if node.maintainability_index < 20 and (node.nloc > 20 or node.cyclomatic_complexity > 5):
-            violations.append({
+        # Rule 4: Low maintainability (MI < 20)
+        if mi < 20 and (node.nloc > 20 or cc > 5):
+            low_maintainability.append({
                 "rule": "low-maintainability",
                 "severity": "medium",
-                "message": f"{node.name}: maintainability_index={node.maintainability_index:.1f}/100, CC={node.cyclomatic_complexity}",
+                "message": f"{name}: maintainability_index={mi:.1f}/100, CC={cc}",
                 "components": [comp_id],
             })
 
-    # Rule 5: High cognitive complexity (> 15 per function, SonarQube threshold)
-    for comp_id, node in components.items():
-        if node.cognitive_complexity > 15:
-            violations.append({
+        # Rule 5: High cognitive complexity (> 15 per function, SonarQube threshold)
+        if cognitive > 15:
+            high_cognitive.append({
                 "rule": "high-cognitive-complexity",
                 "severity": "medium",
-                "message": f"{node.name}: cognitive_complexity={node.cognitive_complexity} (threshold: 15)",
+                "message": f"{name}: cognitive_complexity={cognitive} (threshold: 15)",
                 "components": [comp_id],
             })
 
+        if bc > 0:
+            bc_values.append((comp_id, bc))
+
+    violations.extend(god_components)
+    violations.extend(unstable_hubs)
+    violations.extend(low_maintainability)
+    violations.extend(high_cognitive)
+
     # Rule 6: Strong temporal coupling without code dependency
+    # Index components by file once so each coupling only looks at its two files
+    comps_by_path: Dict[str, List[Node]] = defaultdict(list)
+    if temporal_couplings:
+        for c in components.values():
+            comps_by_path[c.relative_path].append(c)
+
     for coupling in temporal_couplings:
         if coupling["coupling_ratio"] > 0.7:
             # Check if there's a code dependency between these files
-            file_a_comps = [c for c in components.values() if c.relative_path == coupling["file_a"]]
-            file_b_comps = [c for c in components.values() if c.relative_path == coupling["file_b"]]
+            file_a_comps = comps_by_path.get(coupling["file_a"], ())
+            file_b_comps = comps_by_path.get(coupling["file_b"], ())
 
-            has_code_dep = False
-            for a in file_a_comps:
-                for b in file_b_comps:
-                    if b.id in a.depends_on or a.id in b.depends_on:
-                        has_code_dep = True
-                        break
+            has_code_dep = any(
+                b.id in a.depends_on or a.id in b.depends_on
+                for a in file_a_comps
+                for b in file_b_comps
+            )
 
             if not has_code_dep:
                 violations.append({
@@ -102,10 +131,8 @@ def evaluate_rules(
                 })
 
     # Rule 7: Bottleneck components (high betweenness centrality + high fan-in)
-    bc_values = [(cid, n.betweenness_centrality) for cid, n in components.items() if n.betweenness_centrality > 0]
     if bc_values:
-        bc_values.sort(key=lambda x: x[1], reverse=True)
-        top_bottlenecks = bc_values[:max(1, len(bc_values) // 20)]  # top 5%
+        top_bottlenecks = heapq.nlargest(max(1, len(bc_values) // 20), bc_values, key=itemgetter(1))  # top 5%
         for comp_id, bc in top_bottlenecks:
             node = components[comp_id]
             if node.fan_in >= 5:
@@ -1,8 +1,10 @@
+import heapq
 import logging
 import os
 from typing import Dict, Any, List, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
+from operator import itemgetter
 
 from codewiki.utils import file_manager
 from codewiki.analyzer.models.core import Node
@@ -28,23 +30,26 @@ def generate_codebase_map(
             languages.add(ext.lstrip('.'))
 
     # Community aggregation
-    communities_map = defaultdict(lambda: {"node_count": 0, "hub_count": 0, "keywords": defaultdict(float)})
+    node_counts: Counter = Counter()
+    hub_counts: Counter = Counter()
+    community_keywords: Dict[int, Counter] = defaultdict(Counter)
     for node in components.values():
         cid = node.community_id
         if cid >= 0:
-            communities_map[cid]["node_count"] += 1
+            node_counts[cid] += 1
             if node.is_hub:
-                communities_map[cid]["hub_count"] += 1
+                hub_counts[cid] += 1
+            keywords = community_keywords[cid]
             for kw, score in node.tfidf_keywords:
-                communities_map[cid]["keywords"][kw] += score
+                keywords[kw] += score
 
     communities = []
-    for cid, info in sorted(communities_map.items()):
-        top_kw = sorted(info["keywords"].items(), key=lambda x: x[1], reverse=True)[:10]
+    for cid in sorted(node_counts):
+        top_kw = community_keywords[cid].most_common(10)
         communities.append({
             "id": cid,
-            "node_count": info["node_count"],
-            "hub_count": info["hub_count"],
+            "node_count": node_counts[cid],
+            "hub_count": hub_counts[cid],
             "tfidf_keywords": [[kw, round(s, 4)] for kw, s in top_kw]
         })
 
@@ -53,55 +58,99 @@ def generate_codebase_map(
     edges = []
     hub_files = []
     instabilities = []
+    maintainability_total = 0.0
+    high_cognitive = []
+    bottlenecks = []
+    interface_implementations = 0
+    concurrent_components = 0
+    error_returning_functions = 0
+    exported_symbols = 0
 
     for comp_id, node in components.items():
-        nodes.append({
+        # Attributes read more than once below
+        name = node.name
+        is_hub = node.is_hub
+        instability = node.instability
+        maintainability = node.maintainability_index
+        cognitive = node.cognitive_complexity
+        betweenness = node.betweenness_centrality
+        implements_interfaces = node.implements_interfaces
+        spawns_goroutines = node.spawns_goroutines
+        uses_channels = node.uses_channels
+        returns_error = node.returns_error
+        is_exported = node.is_exported
+
+        node_entry = {
             "id": comp_id,
-            "name": node.name,
+            "name": name,
             "type": node.component_type,
             "file_path": node.relative_path,
             "metrics": {
                 "pagerank": round(node.pagerank, 6),
                 "fan_in": node.fan_in,
                 "fan_out": node.fan_out,
-                "instability": round(node.instability, 4),
-                "is_hub": node.is_hub,
+                "instability": round(instability, 4),
+                "is_hub": is_hub,
                 "complexity_score": round(node.complexity_score, 2),
                 "tfidf_keywords": node.tfidf_keywords,
-                "betweenness_centrality": round(node.betweenness_centrality, 6),
+                "betweenness_centrality": round(betweenness, 6),
                 "cyclomatic_complexity": node.cyclomatic_complexity,
-                "cognitive_complexity": node.cognitive_complexity,
+                "cognitive_complexity": cognitive,
                 "nloc": node.nloc,
-                "maintainability_index": round(node.maintainability_index, 2),
+                "maintainability_index": round(maintainability, 2),
             },
             "community_id": node.community_id,
             "depends_on": list(node.depends_on)
-        })
+        }
+        nodes.append(node_entry)
 
         # Advanced analysis data (populated by Go analyzer, extensible to other languages)
-        has_analysis = (node.implements_interfaces or node.spawns_goroutines or
-                        node.uses_channels or node.uses_select or node.returns_error or
-                        node.has_defers or node.has_panic)
-        if has_analysis or node.is_exported:
-            nodes[-1]["analysis"] = {
-                "implements_interfaces": node.implements_interfaces,
-                "spawns_goroutines": node.spawns_goroutines,
-                "uses_channels": node.uses_channels,
-                "uses_select": node.uses_select,
-                "returns_error": node.returns_error,
-                "has_defers": node.has_defers,
-                "has_panic": node.has_panic,
-                "is_exported": node.is_exported,
+        uses_select = node.uses_select
+        has_defers = node.has_defers
+        has_panic = node.has_panic
+        has_analysis = (implements_interfaces or spawns_goroutines or
+                        uses_channels or uses_select or returns_error or
+                        has_defers or has_panic)
+        if has_analysis or is_exported:
+            node_entry["analysis"] = {
+                "implements_interfaces": implements_interfaces,
+                "spawns_goroutines": spawns_goroutines,
+                "uses_channels": uses_channels,
+                "uses_select": uses_select,
+                "returns_error": returns_error,
+                "has_defers": has_defers,
+                "has_panic": has_panic,
+                "is_exported": is_exported,
             }
 
         for dep in node.depends_on:
             edges.append({"source": comp_id, "target": dep, "type": "depends_on"})
 
-        if node.is_hub:
-            hub_files.append(node.name)
-        instabilities.append((node.name, node.instability))
+        if is_hub:
+            hub_files.append(name)
+        instabilities.append((name, instability))
+
+        # Summary metrics, gathered in the same pass over the components
+        maintainability_total += maintainability
+        if cognitive > 15:
+            high_cognitive.append(name)
+        if betweenness > 0.1:
+            bottlenecks.append(name)
+        if implements_interfaces:
+            interface_implementations += 1
+        if spawns_goroutines or uses_channels:
+            concurrent_components += 1
+        if returns_error:
+            error_returning_functions += 1
+        if is_exported:
+            exported_symbols += 1
 
-    instabilities.sort(key=lambda x: x[1], reverse=True)
+    # Only the five least and most stable are reported, so take them with
+    # bounded heaps instead of sorting every component. Scanning the list
+    # reversed and flipping the result keeps the order the stable descending
+    # sort used to give, ties included.
+    most_unstable = heapq.nlargest(5, instabilities, key=itemgetter(1))
+    most_stable = heapq.nsmallest(5, reversed(instabilities), key=itemgetter(1))[::-1]
 
     if circular_deps is None:
         circular_deps = []
@@ -124,16 +173,16 @@ def generate_codebase_map(
             "total_nodes": len(nodes),
             "total_edges": len(edges),
             "hub_files": hub_files,
-            "most_unstable": [name for name, _ in instabilities[:5]],
-            "most_stable": [name for name, _ in instabilities[-5:]],
+            "most_unstable": [name for name, _ in most_unstable],
+            "most_stable": [name for name, _ in most_stable],
             "circular_dependencies": circular_deps,
-            "avg_maintainability": round(sum(n.maintainability_index for n in components.values()) / max(len(components), 1), 1),
-            "high_cognitive_complexity": [n.name for n in components.values() if n.cognitive_complexity > 15][:10],
-            "bottleneck_components": [n.name for n in components.values() if n.betweenness_centrality > 0.1][:10],
-            "interface_implementations": sum(1 for n in components.values() if n.implements_interfaces),
-            "concurrent_components": sum(1 for n in components.values() if n.spawns_goroutines or n.uses_channels),
-            "error_returning_functions": sum(1 for n in components.values() if n.returns_error),
-            "exported_symbols": sum(1 for n in components.values() if n.is_exported),
+            "avg_maintainability": round(maintainability_total / max(len(components), 1), 1),
+            "high_cognitive_complexity": high_cognitive[:10],
+            "bottleneck_components": bottlenecks[:10],
+            "interface_implementations": interface_implementations,
+            "concurrent_components": concurrent_components,
+            "error_returning_functions": error_returning_functions,
+            "exported_symbols": exported_symbols,
         }
     }
 
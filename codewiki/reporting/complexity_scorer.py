@@ -1,13 +1,31 @@
 import logging
 import math
+import os
 import re
-from typing import Dict
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from operator import attrgetter
+from typing import Dict, List, Optional
 import lizard
 from codewiki.analyzer.models.core import Node
 
 logger = logging.getLogger(__name__)
 
 
+# Every token the cognitive score looks at, matched in one scan per line:
+# group 1 is a boolean operator, group 2 a keyword that both increments and
+# nests, group 3 an increment-only keyword and group 4 a nesting-only keyword.
+_COGNITIVE_TOKENS = re.compile(
+    r'(&&|\|\||\band\b|\bor\b)|\b(?:(if|for|while)|(elif|else|catch|case)|(switch))\b'
+)
+# Same pattern for ASCII-only sources, which are scanned as bytes
+_COGNITIVE_TOKENS_BYTES = re.compile(_COGNITIVE_TOKENS.pattern.encode('ascii'))
+# The ASCII characters str.strip() treats as whitespace (bytes.strip() alone
+# would keep \x1c-\x1f)
+_ASCII_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+
 def _compute_cognitive_complexity(source: str) -> int:
     """Compute cognitive complexity (SonarQube-inspired).
 
@@ -15,33 +33,53 @@ def _compute_cognitive_complexity(source: str) -> int:
     - +1 for each: if, elif, else, for, while, catch, switch case, ternary, &&, ||
     - +nesting_increment for nested control flow (nesting starts at 0, increments per level)
     """
+    # Most source is pure ASCII; there the bytes regex engine gives the same
+    # matches and skips the Unicode handling
+    if source.isascii():
+        return _cognitive_score(
+            source.encode('ascii'), _COGNITIVE_TOKENS_BYTES, _ASCII_WHITESPACE,
+            b'\n', b'\t', (b'#', b'//'),
+        )
+    return _cognitive_score(source, _COGNITIVE_TOKENS, None, '\n', '\t', ('#', '//'))
+
+
+def _cognitive_score(source, tokens_re, whitespace, newline, tab, comment_prefixes) -> int:
+    """Line scan behind _compute_cognitive_complexity, for either str or bytes."""
     score = 0
     nesting = 0
-    NESTING_KEYWORDS = re.compile(r'\b(if|for|while|switch)\b')
-    INCREMENT_KEYWORDS = re.compile(r'\b(if|elif|else|for|while|catch|case)\b')
-    BOOLEAN_OPS = re.compile(r'(&&|\|\||\band\b|\bor\b)')
 
-    for line in source.split('\n'):
-        stripped = line.strip()
-        if not stripped or stripped.startswith('#') or stripped.startswith('//'):
+    for line in source.split(newline):
+        stripped = line.strip(whitespace)
+        if not stripped or stripped.startswith(comment_prefixes):
             continue
 
-        # Count boolean operators (each sequence counts as 1)
-        bool_matches = len(BOOLEAN_OPS.findall(stripped))
-        score += bool_matches
-
-        # Count control flow increments
-        increments = INCREMENT_KEYWORDS.findall(stripped)
-        for kw in increments:
-            score += 1 + nesting  # base + nesting penalty
+        nests = False
+        tokens = tokens_re.findall(stripped)
+        if tokens:
+            increments = 0
+            for boolean_op, nesting_kw, increment_kw, _ in tokens:
+                if boolean_op:
+                    # Count boolean operators (each sequence counts as 1)
+                    score += 1
+                elif nesting_kw:
+                    increments += 1
+                    nests = True
+                elif increment_kw:
+                    increments += 1
+                else:
+                    nests = True
+            # Count control flow increments (base + nesting penalty)
+            score += increments * (1 + nesting)
 
-        # Track nesting (simplified via indentation)
-        indent = len(line) - len(line.lstrip())
-        depth = indent // 4 if '\t' not in line else line.count('\t')
-        if NESTING_KEYWORDS.search(stripped):
-            nesting = max(nesting, depth + 1)
-        elif depth == 0:
-            nesting = 0
+        # Track nesting (simplified via indentation); a line that neither
+        # nests nor resets a non-zero level leaves it unchanged
+        if nests or nesting:
+            indent = len(line) - len(line.lstrip(whitespace))
+            depth = indent // 4 if tab not in line else line.count(tab)
+            if nests:
+                nesting = max(nesting, depth + 1)
+            elif depth == 0:
+                nesting = 0
 
     return score
 
@@ -64,6 +102,105 @@ def _compute_maintainability_index(loc: int, cc: int, halstead_volume: float, co
     return max(0.0, round(100 * mi / 171, 2))
 
 
+def _lizard_function_list(file_path: str) -> list:
+    """Run Lizard on one file.
+
+    Must be at module level for pickle compatibility with multiprocessing.
+    """
+    return lizard.analyze_file(file_path).function_list
+
+
+def _run_lizard(file_paths: List[str]) -> Dict[str, list]:
+    """Run Lizard over all files, in worker processes when more than one CPU is available.
+
+    Returns a mapping of file path to Lizard function list; files that fail
+    are logged and left out.
+    """
+    results: Dict[str, list] = {}
+    num_workers = min(os.cpu_count() or 1, len(file_paths))
+
+    if num_workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = {
+                    file_path: executor.submit(_lizard_function_list, file_path)
+                    for file_path in file_paths
+                }
+                for file_path, future in futures.items():
+                    try:
+                        results[file_path] = future.result()
+                    except Exception as e:
+                        logger.warning(f"Lizard analysis failed for {file_path}: {e}")
+            return results
+        except Exception as e:
+            logger.warning(f"Parallel Lizard analysis failed, falling back to sequential: {e}")
+            results = {}
+
+    for file_path in file_paths:
+        try:
+            results[file_path] = _lizard_function_list(file_path)
+        except Exception as e:
+            logger.warning(f"Lizard analysis failed for {file_path}: {e}")
+    return results
+
+
+class _LineRangeIndex:
+    """Components of one file, sorted by start line for matching Lizard functions.
+
+    A Lizard function goes to a component whose line range contains its first
+    or last line, preferring one with the same name, then one whose name
+    appears in Lizard's long name, and otherwise the innermost; without any
+    line overlap it falls back to the same name checks over the whole file.
+    """
+
+    def __init__(self, nodes: List[Node]):
+        self.nodes = sorted(nodes, key=attrgetter("start_line"))
+        self.starts = [node.start_line for node in self.nodes]
+        # Running maximum of end lines, so a backwards scan can stop as soon as
+        # no earlier component can still reach the queried line
+        self.max_ends = list(accumulate((node.end_line for node in self.nodes), max))
+        self.by_name: Dict[str, Node] = {}
+        for node in nodes:
+            self.by_name.setdefault(node.name, node)
+
+    def covering(self, line: int) -> List[Node]:
+        """Components whose range contains line, innermost first."""
+        hits = []
+        i = bisect_right(self.starts, line) - 1
+        while i >= 0 and self.max_ends[i] >= line:
+            if self.nodes[i].end_line >= line:
+                hits.append(self.nodes[i])
+            i -= 1
+        return hits
+
+    def match(self, func_info) -> Optional[Node]:
+        hits = self.covering(func_info.start_line)
+        if func_info.end_line != func_info.start_line:
+            seen = {id(node) for node in hits}
+            hits.extend(node for node in self.covering(func_info.end_line) if id(node) not in seen)
+        if not hits:
+            node = self.by_name.get(func_info.name)
+            if node is None:
+                node = _long_name_match(self.nodes, func_info.long_name)
+            return node
+
+        name = func_info.name
+        for node in hits:
+            if node.name == name or name.endswith("." + node.name):
+                return node
+        # Same tie-breaker as the old linear scan, e.g. "run" in "Server::run( int x )"
+        node = _long_name_match(hits, func_info.long_name)
+        return node if node is not None else hits[0]
+
+
+def _long_name_match(nodes: List[Node], long_name: str) -> Optional[Node]:
+    """First node whose name occurs in a Lizard long name, if any."""
+    for node in nodes:
+        if node.name and node.name in long_name:
+            return node
+    return None
+
+
 def compute_complexity_scores(components: Dict[str, Node]) -> None:
     """Compute complexity metrics for all components using Lizard and custom algorithms."""
     # Group components by file for efficient Lizard analysis
@@ -74,25 +211,21 @@ def compute_complexity_scores(components: Dict[str, Node]) -> None:
                 file_components[node.file_path] = []
             file_components[node.file_path].append(comp_id)
 
-    # Run Lizard per file
+    # Run Lizard on every file, then match its functions to our components
+    lizard_results = _run_lizard(list(file_components))
     for file_path, comp_ids in file_components.items():
-        try:
-            analysis = lizard.analyze_file(file_path)
-            for func_info in analysis.function_list:
-                # Match Lizard functions to our components by line range overlap
-                for comp_id in comp_ids:
-                    node = components[comp_id]
-                    if (node.start_line <= func_info.start_line <= node.end_line or
-                        node.start_line <= func_info.end_line <= node.end_line or
-                        node.name == func_info.name or
-                        node.name in func_info.long_name):
-                        node.cyclomatic_complexity = max(node.cyclomatic_complexity, func_info.cyclomatic_complexity)
-                        node.nloc = max(node.nloc, func_info.nloc)
-                        node.token_count = max(node.token_count, func_info.token_count)
-                        node.parameter_count = max(node.parameter_count, len(func_info.parameters))
-                        break
-        except Exception as e:
-            logger.warning(f"Lizard analysis failed for {file_path}: {e}")
+        function_list = lizard_results.get(file_path)
+        if not function_list:
+            continue
+        matcher = _LineRangeIndex([components[comp_id] for comp_id in comp_ids])
+        for func_info in function_list:
+            node = matcher.match(func_info)
+            if node is None:
+                continue
+            node.cyclomatic_complexity = max(node.cyclomatic_complexity, func_info.cyclomatic_complexity)
+            node.nloc = max(node.nloc, func_info.nloc)
+            node.token_count = max(node.token_count, func_info.token_count)
+            node.parameter_count = max(node.parameter_count, len(func_info.parameters))
 
     # Compute cognitive complexity and maintainability index from source code
     for comp_id, node in components.items():
@@ -106,9 +239,9 @@ def compute_complexity_scores(components: Dict[str, Node]) -> None:
         halstead_volume = node.token_count * math.log2(max(node.token_count, 2)) if node.token_count > 0 else 1.0
 
         # Comment ratio (approximate)
-        lines = node.source_code.split('\n')
-        total_lines = len([l for l in lines if l.strip()])
-        comment_lines = len([l for l in lines if l.strip().startswith('#') or l.strip().startswith('//')])
+        code_lines = [l for l in map(str.strip, node.source_code.split('\n')) if l]
+        total_lines = len(code_lines)
+        comment_lines = sum(1 for l in code_lines if l.startswith(('#', '//')))
         comment_ratio = comment_lines / max(total_lines, 1)
 
         loc = node.nloc if node.nloc > 0 else total_lines
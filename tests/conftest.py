@@ -0,0 +1,13 @@
+from codewiki.analyzer.models.core import Node
+
+
+def make_node(comp_id, path="pkg/a.py", **fields):
+    """Build a function Node named after the last part of its id."""
+    fields.setdefault("component_type", "function")
+    return Node(
+        id=comp_id,
+        name=comp_id.split(".")[-1],
+        file_path=f"/repo/{path}",
+        relative_path=path,
+        **fields,
+    )
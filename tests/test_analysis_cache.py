@@ -0,0 +1,105 @@
+import sqlite3
+
+from codewiki.analyzer.analysis import call_graph_analyzer
+from codewiki.analyzer.analysis.analysis_cache import (
+    close_cache,
+    content_digest,
+    load_result,
+    prune_results,
+    store_result,
+)
+from codewiki.analyzer.analysis.call_graph_analyzer import analyze_single_file
+
+
+def test_cache_round_trip_checks_content(tmp_path):
+    cache_path = str(tmp_path / "cache.sqlite3")
+    digest = content_digest(b"def f(): pass\n")
+
+    assert load_result(cache_path, "/repo", "/repo/a.py", "python", digest) is None
+    store_result(cache_path, "/repo", "/repo/a.py", "python", digest, ([], []))
+    assert load_result(cache_path, "/repo", "/repo/a.py", "python", digest) == ([], [])
+
+    changed = content_digest(b"def g(): pass\n")
+    assert load_result(cache_path, "/repo", "/repo/a.py", "python", changed) is None
+    assert load_result(cache_path, "/repo", "/repo/a.py", "go", digest) is None
+    assert load_result(cache_path, "/", "/repo/a.py", "python", digest) is None
+
+
+def test_unchanged_file_is_not_reanalyzed(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    source = repo / "mod.py"
+    source.write_text("def f():\n    return g()\n\ndef g():\n    return 1\n")
+    cache_path = str(tmp_path / "cache.sqlite3")
+    file_info = {"path": "mod.py", "language": "python"}
+
+    dispatch = call_graph_analyzer._dispatch_language_analyzer
+    calls = []
+
+    def counting_dispatch(*args):
+        calls.append(args[1])
+        return dispatch(*args)
+
+    monkeypatch.setattr(call_graph_analyzer, "_dispatch_language_analyzer", counting_dispatch)
+
+    first = analyze_single_file(str(repo), file_info, cache_path)
+    second = analyze_single_file(str(repo), file_info, cache_path)
+    assert len(calls) == 1
+    assert first[2] is None
+    assert sorted(first[0]) == sorted(second[0])
+    assert [(r.caller, r.callee) for r in first[1]] == [(r.caller, r.callee) for r in second[1]]
+
+    source.write_text("def f():\n    return 2\n")
+    analyze_single_file(str(repo), file_info, cache_path)
+    assert len(calls) == 2
+
+
+def test_cache_is_scoped_to_the_repository_root(tmp_path):
+    sub = tmp_path / "r" / "sub"
+    (sub / "pkg").mkdir(parents=True)
+    (sub / "pkg" / "a.py").write_text("class Foo:\n    pass\n")
+    cache_path = str(tmp_path / "cache.sqlite3")
+
+    inner = analyze_single_file(str(sub), {"path": "pkg/a.py", "language": "python"}, cache_path)
+    outer = analyze_single_file(str(tmp_path / "r"), {"path": "sub/pkg/a.py", "language": "python"}, cache_path)
+
+    assert sorted(inner[0]) == ["pkg.a.Foo"]
+    assert sorted(outer[0]) == ["sub.pkg.a.Foo"]
+
+
+def test_close_cache_removes_wal_files(tmp_path):
+    cache_path = str(tmp_path / "cache" / "cache.sqlite3")
+    digest = content_digest(b"")
+    store_result(cache_path, "/repo", "/repo/a.py", "python", digest, ([], []))
+
+    close_cache(cache_path)
+
+    assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == ["cache.sqlite3"]
+    assert load_result(cache_path, "/repo", "/repo/a.py", "python", digest) == ([], [])
+
+
+def test_old_schema_is_rebuilt(tmp_path):
+    cache_path = str(tmp_path / "cache.sqlite3")
+    conn = sqlite3.connect(cache_path)
+    conn.execute("CREATE TABLE results (path TEXT, lang TEXT, sha BLOB, ver TEXT, blob BLOB)")
+    conn.commit()
+    conn.close()
+    digest = content_digest(b"")
+
+    store_result(cache_path, "/repo", "/repo/a.py", "python", digest, ([], []))
+    assert load_result(cache_path, "/repo", "/repo/a.py", "python", digest) == ([], [])
+    close_cache(cache_path)
+
+
+def test_prune_drops_files_missing_from_the_run(tmp_path):
+    cache_path = str(tmp_path / "cache.sqlite3")
+    digest = content_digest(b"")
+    for root, path in [("/repo", "/repo/a.py"), ("/repo", "/repo/gone.py"), ("/other", "/other/gone.py")]:
+        store_result(cache_path, root, path, "python", digest, ([], []))
+
+    prune_results(cache_path, "/repo", {"/repo/a.py"})
+
+    assert load_result(cache_path, "/repo", "/repo/a.py", "python", digest) == ([], [])
+    assert load_result(cache_path, "/repo", "/repo/gone.py", "python", digest) is None
+    assert load_result(cache_path, "/other", "/other/gone.py", "python", digest) == ([], [])
+    close_cache(cache_path)
@@ -0,0 +1,67 @@
+from codewiki.reporting.arch_rules import evaluate_rules
+
+from conftest import make_node
+
+
+def _rules(violations):
+    return [v["rule"] for v in violations]
+
+
+def test_no_violations_for_healthy_components():
+    components = {"pkg.a.f": make_node("pkg.a.f")}
+    assert evaluate_rules(components) == []
+
+
+def test_per_node_rules():
+    components = {
+        "pkg.a.god": make_node("pkg.a.god", fan_in=12, complexity_score=80.0),
+        "pkg.a.hub": make_node("pkg.a.hub", is_hub=True, instability=0.9),
+        "pkg.a.messy": make_node("pkg.a.messy", maintainability_index=10.0, nloc=40),
+        "pkg.a.deep": make_node("pkg.a.deep", cognitive_complexity=20),
+    }
+    violations = evaluate_rules(components)
+    by_rule = {v["rule"]: v["components"] for v in violations}
+
+    assert by_rule == {
+        "no-god-components": ["pkg.a.god"],
+        "no-unstable-hubs": ["pkg.a.hub"],
+        "low-maintainability": ["pkg.a.messy"],
+        "high-cognitive-complexity": ["pkg.a.deep"],
+    }
+
+
+def test_violations_sorted_by_severity():
+    components = {
+        "pkg.a.deep": make_node("pkg.a.deep", cognitive_complexity=20),
+        "pkg.a.god": make_node("pkg.a.god", fan_in=12, complexity_score=80.0),
+    }
+    cycle = ("a", "b", "c", "d")
+    violations = evaluate_rules(components, circular_deps=[cycle])
+    assert [v["severity"] for v in violations] == ["high", "high", "medium"]
+    assert _rules(violations)[0] == "no-long-circular-deps"
+
+
+def test_hidden_coupling_ignores_files_with_code_dependency():
+    a = make_node("pkg.a.f", path="pkg/a.py")
+    b = make_node("pkg.b.g", path="pkg/b.py")
+    c = make_node("pkg.c.h", path="pkg/c.py")
+    a.depends_on.add(b.id)
+    components = {n.id: n for n in (a, b, c)}
+    couplings = [
+        {"file_a": "pkg/a.py", "file_b": "pkg/b.py", "coupling_ratio": 0.9},
+        {"file_a": "pkg/a.py", "file_b": "pkg/c.py", "coupling_ratio": 0.9},
+        {"file_a": "pkg/b.py", "file_b": "pkg/c.py", "coupling_ratio": 0.5},
+    ]
+    violations = evaluate_rules(components, temporal_couplings=couplings)
+    assert _rules(violations) == ["hidden-coupling"]
+    assert violations[0]["message"].startswith("pkg/a.py ↔ pkg/c.py")
+
+
+def test_bottleneck_takes_top_five_percent():
+    components = {
+        f"pkg.a.f{i}": make_node(f"pkg.a.f{i}", betweenness_centrality=i / 100, fan_in=5)
+        for i in range(1, 41)
+    }
+    violations = evaluate_rules(components)
+    assert _rules(violations) == ["bottleneck-component", "bottleneck-component"]
+    assert [v["components"][0] for v in violations] == ["pkg.a.f40", "pkg.a.f39"]
@@ -0,0 +1,138 @@
+from codewiki.analyzer.analysis import call_graph_analyzer
+from codewiki.analyzer.analysis.call_graph_analyzer import CallGraphAnalyzer
+from codewiki.analyzer.models.core import CallRelationship
+
+from conftest import make_node
+
+
+def _analyzer(funcs, rels):
+    analyzer = CallGraphAnalyzer()
+    analyzer.functions = {f.id: f for f in funcs}
+    analyzer.call_relationships = rels
+    return analyzer
+
+
+def test_extract_code_files_keeps_supported_extensions():
+    tree = {
+        "type": "directory", "name": ".", "path": ".",
+        "children": [
+            {"type": "file", "name": "a.py", "path": "a.py", "extension": ".py", "_size_bytes": 10},
+            {"type": "file", "name": "notes.txt", "path": "notes.txt", "extension": ".txt"},
+            {"type": "directory", "name": "sub", "path": "sub", "children": [
+                {"type": "file", "name": "b.GO", "path": "sub/b.GO", "extension": ".GO", "_size_bytes": 5},
+            ]},
+        ],
+    }
+    files = CallGraphAnalyzer().extract_code_files(tree)
+    assert [(f["path"], f["language"], f["size"]) for f in files] == [
+        ("a.py", "python", 10),
+        ("sub/b.GO", "go", 5),
+    ]
+
+
+def test_resolve_and_deduplicate_relationships():
+    caller = make_node("pkg.mod.main")
+    helper = make_node("pkg.mod.helper")
+    other = make_node("other.mod.helper", path="other/mod.py")
+    rels = [
+        CallRelationship(caller=caller.id, callee="helper"),
+        CallRelationship(caller=caller.id, callee="helper"),
+        CallRelationship(caller=caller.id, callee="missing"),
+    ]
+    analyzer = _analyzer([caller, helper, other], rels)
+
+    analyzer._resolve_call_relationships()
+    analyzer._deduplicate_relationships()
+
+    assert [(r.callee, r.is_resolved) for r in analyzer.call_relationships] == [
+        ("pkg.mod.helper", True),
+        ("missing", False),
+    ]
+
+
+def test_dotted_receiver_call_resolves_by_short_key():
+    caller = make_node("server.serve", path="http/server.go")
+    logf = make_node("server.logf", path="http/server.go")
+    other = make_node("transport.transportRequest.logf", path="http/transport.go")
+    rels = [CallRelationship(caller=caller.id, callee="w.conn.server.logf")]
+    analyzer = _analyzer([caller, logf, other], rels)
+
+    analyzer._resolve_call_relationships()
+
+    assert [(r.callee, r.is_resolved) for r in analyzer.call_relationships] == [
+        ("server.logf", True),
+    ]
+
+
+def test_generate_llm_format_matches_whole_names():
+    foo = make_node("pkg.mod.foo")
+    barfoo = make_node("pkg.mod.barfoo")
+    rels = [
+        CallRelationship(caller=foo.id, callee=barfoo.id, is_resolved=True),
+        CallRelationship(caller=barfoo.id, callee=barfoo.id, is_resolved=True),
+    ]
+    llm = _analyzer([foo, barfoo], rels).generate_llm_format()
+
+    assert llm["relationships"]["foo"] == {"calls": ["pkg.mod.barfoo"], "called_by": []}
+    assert llm["relationships"]["barfoo"] == {
+        "calls": ["pkg.mod.barfoo"],
+        "called_by": ["pkg.mod.foo", "pkg.mod.barfoo"],
+    }
+    assert {f["name"]: f["is_recursive"] for f in llm["functions"]} == {"foo": False, "barfoo": True}
+
+
+def test_generate_llm_format_recursion_needs_the_same_id():
+    close = make_node("pkg.w.Writer.Close", path="pkg/w.go")
+    inner = make_node("pkg.f.File.Close", path="pkg/f.go")
+    rels = [CallRelationship(caller=close.id, callee=inner.id, is_resolved=True)]
+    llm = _analyzer([close, inner], rels).generate_llm_format()
+
+    assert [f["is_recursive"] for f in llm["functions"]] == [False, False]
+
+
+def test_blank_files_skip_the_language_analyzers(monkeypatch):
+    monkeypatch.setattr(call_graph_analyzer, "_language_analyzer", None)
+    for content in ("", " \n\t\n"):
+        assert call_graph_analyzer._dispatch_language_analyzer("go", "a.go", content, ".") == ([], [])
+    assert call_graph_analyzer._dispatch_language_analyzer("cobol", "a.cob", "", ".") is None
+
+
+def test_decode_source_matches_text_mode_reads():
+    assert call_graph_analyzer._decode_source(b"x = 1\n") == ("x = 1\n", b"x = 1\n")
+    # Newline translation and invalid bytes mean the raw bytes cannot be reused
+    assert call_graph_analyzer._decode_source(b"a\r\nb\r") == ("a\nb\n", None)
+    assert call_graph_analyzer._decode_source(b"a\xffb") == ("a�b", None)
+
+
+def test_batch_by_size_balances_bytes():
+    sizes = [100, 1, 1, 1, 1, 50, 50, 0]
+    batches = call_graph_analyzer._batch_by_size([{"size": size} for size in sizes], 2)
+
+    assert sorted(i for batch in batches for i in batch) == list(range(len(sizes)))
+    assert all(batch == sorted(batch) for batch in batches)
+    assert sorted(sum(max(sizes[i], 1) for i in batch) for batch in batches) == [102, 103]
+    assert call_graph_analyzer._batch_by_size([{"size": 5}], 8) == [[0]]
+
+
+def test_parallel_merge_matches_sequential_run(tmp_path, monkeypatch):
+    children = []
+    for i, size in enumerate([300, 10, 120, 5, 60, 200]):
+        source = f"def f{i}():\n    g{i}()\n\ndef g{i}():\n    pass\n" + "x = 1\n" * size
+        (tmp_path / f"m{i}.py").write_text(source)
+        children.append({"type": "file", "name": f"m{i}.py", "path": f"m{i}.py",
+                         "extension": ".py", "_size_bytes": len(source)})
+    # Listing a file twice makes its ids collide across batches
+    tree = {"type": "directory", "name": ".", "path": ".", "children": children + children[:2]}
+    code_files = CallGraphAnalyzer().extract_code_files(tree)
+
+    parallel = CallGraphAnalyzer().analyze_code_files(code_files, str(tmp_path))
+
+    def no_pool(*args, **kwargs):
+        raise RuntimeError("force the sequential path")
+
+    monkeypatch.setattr(call_graph_analyzer, "ProcessPoolExecutor", no_pool)
+    sequential = CallGraphAnalyzer().analyze_code_files(code_files, str(tmp_path))
+
+    assert parallel["functions"] == sequential["functions"]
+    assert parallel["relationships"] == sequential["relationships"]
+    assert parallel["call_graph"] == sequential["call_graph"]
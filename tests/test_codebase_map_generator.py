@@ -0,0 +1,59 @@
+import json
+
+from codewiki.reporting.codebase_map_generator import generate_codebase_map
+
+from conftest import make_node
+
+
+def _generate(tmp_path, components, **kwargs):
+    generate_codebase_map(components, str(tmp_path), "abc123", "/repo/project", **kwargs)
+    return json.loads((tmp_path / "codebase_map.json").read_text())
+
+
+def test_communities_aggregate_keywords(tmp_path):
+    components = {
+        "pkg.a.f": make_node("pkg.a.f", community_id=1, is_hub=True,
+                         tfidf_keywords=[("parse", 0.5), ("token", 0.25)]),
+        "pkg.a.g": make_node("pkg.a.g", community_id=1,
+                         tfidf_keywords=[("token", 0.5), ("lexer", 0.1)]),
+        "pkg.b.h": make_node("pkg.b.h", path="pkg/b.go", community_id=0,
+                         tfidf_keywords=[("http", 1.0)]),
+        "pkg.c.i": make_node("pkg.c.i", community_id=-1, tfidf_keywords=[("ignored", 1.0)]),
+    }
+    codebase_map = _generate(tmp_path, components)
+
+    assert codebase_map["metadata"]["project_name"] == "project"
+    assert codebase_map["metadata"]["languages"] == ["go", "py"]
+    assert codebase_map["communities"] == [
+        {"id": 0, "node_count": 1, "hub_count": 0, "tfidf_keywords": [["http", 1.0]]},
+        {"id": 1, "node_count": 2, "hub_count": 1,
+         "tfidf_keywords": [["token", 0.75], ["parse", 0.5], ["lexer", 0.1]]},
+    ]
+
+
+def test_nodes_edges_and_summary(tmp_path):
+    a = make_node("pkg.a.f", instability=0.9, cognitive_complexity=20,
+              maintainability_index=40.0, betweenness_centrality=0.2)
+    b = make_node("pkg.a.g", instability=0.1, maintainability_index=80.0,
+              returns_error=True, is_exported=True)
+    a.depends_on.add(b.id)
+    codebase_map = _generate(tmp_path, {a.id: a, b.id: b}, circular_deps=[["x", "y"]])
+
+    assert [n["id"] for n in codebase_map["nodes"]] == ["pkg.a.f", "pkg.a.g"]
+    assert "analysis" not in codebase_map["nodes"][0]
+    assert codebase_map["nodes"][1]["analysis"]["returns_error"] is True
+    assert codebase_map["edges"] == [
+        {"source": "pkg.a.f", "target": "pkg.a.g", "type": "depends_on"}
+    ]
+
+    summary = codebase_map["summary_metrics"]
+    assert summary["total_nodes"] == 2
+    assert summary["total_edges"] == 1
+    assert summary["most_unstable"][0] == "f"
+    assert summary["most_stable"][-1] == "g"
+    assert summary["circular_dependencies"] == [["x", "y"]]
+    assert summary["avg_maintainability"] == 60.0
+    assert summary["high_cognitive_complexity"] == ["f"]
+    assert summary["bottleneck_components"] == ["f"]
+    assert summary["error_returning_functions"] == 1
+    assert summary["exported_symbols"] == 1
@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+from codewiki.reporting.complexity_scorer import _LineRangeIndex, _compute_cognitive_complexity
+
+from conftest import make_node
+
+
+def _func(name, start, end, long_name=None):
+    if long_name is None:
+        long_name = f"{name}( self )"
+    return SimpleNamespace(name=name, long_name=long_name, start_line=start, end_line=end)
+
+
+def test_flat_code_scores_zero():
+    assert _compute_cognitive_complexity("x = 1\ny = x + 2\n") == 0
+    assert _compute_cognitive_complexity("") == 0
+
+
+def test_boolean_operators_and_branches():
+    source = "if a and b or c:\n    pass\nelse:\n    pass\n"
+    # if (+1), and (+1), or (+1), else (+1 +1 nesting still open from the if)
+    assert _compute_cognitive_complexity(source) == 5
+
+
+def test_nested_control_flow_adds_nesting_penalty():
+    source = (
+        "for x in xs:\n"
+        "    if x:\n"
+        "        while y:\n"
+        "            pass\n"
+    )
+    # for (+1), if (+1 +1 nesting), while (+1 +2 nesting)
+    assert _compute_cognitive_complexity(source) == 6
+
+
+def test_nesting_resets_at_top_level():
+    source = "if a:\n    pass\nx = 1\nif b:\n    pass\n"
+    assert _compute_cognitive_complexity(source) == 2
+
+
+def test_comment_lines_are_ignored():
+    source = "# if a and b\n// while (x || y)\nfunc()\n"
+    assert _compute_cognitive_complexity(source) == 0
+
+
+def test_brace_languages():
+    source = (
+        "func f() {\n"
+        "\tswitch x {\n"
+        "\tcase 1:\n"
+        "\t\tif a && b {\n"
+        "\t\t}\n"
+        "\t}\n"
+        "}\n"
+    )
+    # case (+1 +2 nesting from switch), if (+1 +2), && (+1)
+    assert _compute_cognitive_complexity(source) == 7
+
+
+def test_lizard_functions_match_their_own_component():
+    cls = make_node("pkg.mod.Parser", start_line=1, end_line=40, component_type="class")
+    method = make_node("pkg.mod.parse", start_line=10, end_line=20)
+    other = make_node("pkg.mod.tokenize", start_line=22, end_line=40)
+    index = _LineRangeIndex([cls, method, other])
+
+    # The enclosing class overlaps too, but the same-named method wins
+    assert index.match(_func("parse", 10, 20)) is method
+    assert index.match(_func("Parser.tokenize", 22, 40)) is other
+    # An anonymous closure goes to the innermost enclosing component
+    assert index.match(_func("", 12, 14)) is method
+
+
+def test_lizard_long_name_breaks_ties_before_innermost():
+    run = make_node("pkg.mod.run", start_line=5, end_line=20)
+    callback = make_node("pkg.mod.callback", start_line=5, end_line=6)
+    index = _LineRangeIndex([run, callback])
+
+    # The nested callback is innermost, but the long name names the method
+    assert index.match(_func("Server::run", 5, 20, "Server::run( int x )")) is run
+    assert index.match(_func("", 5, 6)) is callback
+
+
+def test_lizard_function_without_overlap_falls_back_to_name():
+    node = make_node("pkg.mod.helper", start_line=5, end_line=8)
+    index = _LineRangeIndex([node])
+    assert index.match(_func("helper", 50, 60)) is node
+    assert index.match(_func("unrelated", 50, 60)) is None
+    assert index.match(_func("Server::helper", 50, 60, "Server::helper( )")) is node
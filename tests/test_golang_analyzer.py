@@ -0,0 +1,176 @@
+from codewiki.analyzer.languages.golang import analyze_go_file
+
+SOURCE = """package shapes
+
+import "fmt"
+
+type Shape interface {
+	Area() float64
+}
+
+type Square struct {
+	Side float64
+}
+
+func (s *Square) Area() float64 {
+	return s.Side * s.Side
+}
+
+func Describe(s Shape) string {
+	return fmt.Sprintf("%v", s.Area())
+}
+"""
+
+
+def _analyze(source=SOURCE):
+    return analyze_go_file("/repo/shapes/shapes.go", source, repo_path="/repo")
+
+
+def test_extracts_types_and_functions():
+    nodes, _, interface_methods, struct_methods = _analyze()
+    by_id = {node.id: node for node in nodes}
+
+    assert by_id["shapes.shapes.Shape"].component_type == "interface"
+    assert by_id["shapes.shapes.Square"].component_type == "struct"
+    area = by_id["shapes.shapes.Square.Area"]
+    assert area.component_type == "method"
+    assert area.class_name == "Square"
+    assert by_id["shapes.shapes.Describe"].is_exported
+    assert interface_methods == {"Shape": {"Area#0"}}
+    assert struct_methods == {"Square": {"Area#0"}}
+
+
+def test_extracts_calls():
+    _, rels, _, _ = _analyze()
+    # The parameter's static type resolves the interface method call
+    assert {(rel.caller, rel.callee) for rel in rels} == {
+        ("shapes.shapes.Describe", "Shape.Area"),
+        ("shapes.shapes.Describe", "fmt.Sprintf"),
+    }
+
+
+def test_unparseable_input_yields_nothing():
+    nodes, rels, _, _ = _analyze("")
+    assert nodes == [] and rels == []
+
+
+def test_calls_outside_functions_are_ignored():
+    source = """package p
+
+var registry = build()
+
+func build() map[string]int {
+	type entry struct{ n int }
+	return helper(entry{}.n)
+}
+
+func helper(n int) map[string]int { return nil }
+"""
+    nodes, rels, _, _ = _analyze(source)
+
+    assert [node.name for node in nodes] == ["build", "entry", "helper"]
+    assert [(rel.caller, rel.callee, rel.is_resolved) for rel in rels] == [
+        ("shapes.shapes.build", "shapes.shapes.helper", True),
+    ]
+
+
+def test_embedded_primitive_detection():
+    source = """package p
+
+type Base struct{}
+
+type Wrapper struct {
+	Base
+	Value any
+	apiError
+	muintptr
+}
+"""
+    _, rels, _, _ = _analyze(source)
+
+    # "map[" used to be lstrip()ped as a character set, which turned "any"
+    # into "ny" and let the builtin through, and "muintptr" into the
+    # primitive "uintptr" and dropped the embed
+    assert [(rel.caller, rel.callee) for rel in rels] == [
+        ("shapes.shapes.Wrapper", "Base"),
+        ("shapes.shapes.Wrapper", "apiError"),
+        ("shapes.shapes.Wrapper", "muintptr"),
+    ]
+
+
+def test_function_body_patterns():
+    source = """package jobs
+
+func Run(ch chan int) {
+	defer close(ch)
+	go func() {
+		ch <- 1
+	}()
+	panic("stop")
+}
+"""
+    nodes, _, _, _ = _analyze(source)
+    run = nodes[0]
+    assert run.spawns_goroutines and run.has_defers and run.has_panic and run.uses_channels
+    assert not run.uses_select
+
+
+def test_parses_given_source_bytes():
+    nodes, rels, _, _ = analyze_go_file(
+        "/repo/shapes/shapes.go", SOURCE, repo_path="/repo", source=SOURCE.encode("utf8")
+    )
+    expected_nodes, expected_rels, _, _ = _analyze()
+    assert [node.model_dump() for node in nodes] == [node.model_dump() for node in expected_nodes]
+    assert rels == expected_rels
+
+
+def test_docstrings_come_from_the_adjacent_comment_block():
+    source = """package docs
+
+// Detached comment.
+
+// First line.
+//   Second line.
+func Documented() {}
+
+var x = 1 // trailing comment
+func Trailing() {}
+
+/* block comment */
+func Block() {}
+
+func Local() {
+	// Local type.
+	type point struct{}
+}
+"""
+    nodes, _, _, _ = _analyze(source)
+    docs = {node.name: node.docstring for node in nodes}
+    assert docs == {
+        "Documented": "First line.\nSecond line.",
+        "Trailing": "",
+        "Block": "",
+        "point": "Local type.",
+        "Local": "",
+    }
+
+
+def test_file_without_declarations_yields_nothing():
+    source = 'package docs\n\nimport "fmt"\n\nvar _ = fmt.Sprintf("%d", 1)\n'
+    assert _analyze(source) == ([], [], {}, {})
+
+
+def test_call_rooted_selector_chain_resolves_method():
+    source = """package buf
+
+type wbBuf struct{}
+
+func (b *wbBuf) discard() {}
+
+func flush() {
+	getg().wbBuf.discard()
+}
+"""
+    _, rels, _, _ = _analyze(source)
+    discard = [rel for rel in rels if rel.callee.endswith("discard")]
+    assert [(rel.callee, rel.is_resolved) for rel in discard] == [("shapes.shapes.wbBuf.discard", True)]